@@ -37,10 +37,11 @@ def main() -> int:
     # detect-secrets may update the baseline (e.g., generated_at) even when
     # running in a read-only "check" mode. Run against a temporary copy to
     # keep the git working tree clean.
-    baseline_payload = baseline_path.read_text(encoding="utf-8")
-    with tempfile.NamedTemporaryFile(mode="w", encoding="utf-8", suffix=".baseline", delete=False) as tf:
-        tf.write(baseline_payload)
-        tmp_baseline = tf.name
+    # mkstemp returns a bare fd + path, skipping the _TemporaryFileWrapper
+    # that NamedTemporaryFile builds only for delete=False to disable.
+    fd, tmp_baseline = tempfile.mkstemp(suffix=".baseline")
+    with open(fd, "w", encoding="utf-8") as tf:
+        tf.write(baseline_path.read_text(encoding="utf-8"))
 
     proc = subprocess.run(
         ["detect-secrets", "scan", "--baseline", tmp_baseline],
@@ -2,7 +2,11 @@
 Shared utilities for devto-mirror scripts
 """
 
+import functools
+import math
 import pathlib
+import re
+import sys
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 
@@ -29,8 +33,8 @@ def get_post_template():
 
         logging.debug(f"Failed to load post template from file: {e}")
 
-    # Fallback to inline template
-    return env.from_string(POST_TEMPLATE_INLINE)
+    # Fallback to inline template (precompiled once at import)
+    return _FALLBACK_TEMPLATE
 
 
 # Inline post template as fallback
@@ -160,6 +164,10 @@ POST_TEMPLATE_INLINE = """<!doctype html><html lang="en"><head>
 </main>
 </body></html>"""
 
+# Compile the fallback once; Jinja compilation is parser + codegen work that
+# shouldn't be repeated on every template-lookup miss.
+_FALLBACK_TEMPLATE = env.from_string(POST_TEMPLATE_INLINE)
+
 # Shared templates
 INDEX_TMPL = env.from_string("""<!doctype html><html lang="en"><head>
 <meta charset="utf-8">
@@ -234,47 +242,74 @@ SITEMAP_TMPL = env.from_string("""<?xml version="1.0" encoding="UTF-8"?>
 """)
 
 
-def _parse_iso_date_str(s: str) -> datetime:
-    """Parse an ISO date string, handling the 'Z' suffix."""
-    if s.endswith("Z"):
-        return datetime.fromisoformat(s.replace("Z", "+00:00"))
-    return datetime.fromisoformat(s)
+# Shared sort fallback; datetime is immutable so one instance serves all calls.
+_MIN_UTC = datetime.min.replace(tzinfo=timezone.utc)
 
+# Interned keys for the hot dedup helpers: identity-equal strings let dict
+# lookups short-circuit on pointer comparison instead of hashing + equality.
+_K_ID = sys.intern("id")
+_K_LINK = sys.intern("link")
+_K_API_DATA = sys.intern("api_data")
+_K_EDITED_AT = sys.intern("edited_at")
+_K_UPDATED_AT = sys.intern("updated_at")
+_K_PUBLISHED_AT = sys.intern("published_at")
+_K_DATE = sys.intern("date")
 
-def parse_date(date_str):
-    """
-    Unified date parsing function that handles various formats.
-    Returns timezone-aware datetime when possible, otherwise None.
-    """
-    if not date_str:
-        return None
 
-    if isinstance(date_str, datetime):
-        dt = date_str
-        # Normalize naive datetimes to UTC to avoid comparison errors
-        if dt.tzinfo is None:
-            return dt.replace(tzinfo=timezone.utc)
-        return dt
+# Exact canonical shape of a DEV feed timestamp; anything else takes the
+# generic parse path. ASCII-only so locale digits can't sneak past int().
+_CANON_Z = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z", re.ASCII)
 
-    if isinstance(date_str, (int, float)):
+
+def _fast_parse_z(s: str) -> datetime | None:
+    """Parse the fixed ``YYYY-MM-DDTHH:MM:SSZ`` shape with direct slicing.
+
+    DEV timestamps are almost always exactly this shape; six int() slices
+    skip fromisoformat's general format dispatch.
+    """
+    if _CANON_Z.fullmatch(s):
         try:
-            dt = datetime.fromtimestamp(date_str)
-            if dt.tzinfo is None:
-                return dt.replace(tzinfo=timezone.utc)
-            return dt
-        except Exception:
+            return datetime(
+                int(s[:4]),
+                int(s[5:7]),
+                int(s[8:10]),
+                int(s[11:13]),
+                int(s[14:16]),
+                int(s[17:19]),
+                tzinfo=timezone.utc,
+            )
+        except ValueError:
             return None
+    return None
+
 
-    s = str(date_str).strip()
+def _parse_iso_date_str(s: str) -> datetime:
+    """Parse an ISO date string via the C-implemented fast path.
+
+    Python 3.11+ fromisoformat accepts the 'Z' suffix (and tz-less ISO
+    strings) natively, so no pre-processing is needed.
+    """
+    return datetime.fromisoformat(s)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date_str_cached(s: str) -> datetime | None:
+    """Parse a date string, memoized.
+
+    Feed timestamps repeat heavily across posts and the dedup sort re-parses
+    them O(N log N) times, so caching by the raw string skips most of the work.
+    datetimes are immutable, so sharing the cached result is safe.
+    """
+    dt = _fast_parse_z(s)
+    if dt is not None:
+        return dt
 
     # Try different parsing formats in order
     formats_to_try = [
-        # ISO format with Z
+        # ISO format (with or without Z / timezone offset)
         _parse_iso_date_str,
         # RFC-style parse
         parsedate_to_datetime,
-        # Basic ISO without timezone
-        lambda s: datetime.strptime(s, "%Y-%m-%dT%H:%M:%S"),
     ]
 
     for parse_func in formats_to_try:
@@ -289,19 +324,50 @@ def parse_date(date_str):
     return None
 
 
+def parse_date(date_str):
+    """
+    Unified date parsing function that handles various formats.
+    Returns timezone-aware datetime when possible, otherwise None.
+    """
+    if not date_str:
+        return None
+
+    if isinstance(date_str, datetime):
+        # Already-aware datetimes pass straight through with no allocation;
+        # naive ones are normalized to UTC to avoid comparison errors.
+        if date_str.tzinfo is not None:
+            return date_str
+        return date_str.replace(tzinfo=timezone.utc)
+
+    if isinstance(date_str, (int, float)):
+        # Cheap comparison instead of letting inf/NaN raise inside
+        # fromtimestamp; exceptions are far slower than the check.
+        if not math.isfinite(date_str):
+            return None
+        try:
+            return datetime.fromtimestamp(date_str, tz=timezone.utc)
+        except (OverflowError, OSError, ValueError):
+            return None
+
+    return _parse_date_str_cached(str(date_str).strip())
+
+
 def _post_identity_key(post_dict: dict) -> str | None:
     """Return a stable identity key for a post dict (id-based or link-based)."""
-    api_data = post_dict.get("api_data") if isinstance(post_dict.get("api_data"), dict) else {}
-    try:
-        post_id = int(post_dict.get("id") or api_data.get("id") or 0)
-    except (TypeError, ValueError):
-        post_id = 0
+    api_data = post_dict.get(_K_API_DATA)
+    if not isinstance(api_data, dict):
+        api_data = {}
+    post_id = post_dict.get(_K_ID) or api_data.get(_K_ID) or 0
+    if not isinstance(post_id, int):
+        # Ids are normally ints already; only strings pay the try/except.
+        try:
+            post_id = int(post_id)
+        except (TypeError, ValueError):
+            post_id = 0
     if post_id:
         return f"id:{post_id}"
 
-    link = (post_dict.get("link") or "").strip()
-    if link.endswith("/"):
-        link = link[:-1]
+    link = (post_dict.get(_K_LINK) or "").strip().removesuffix("/")
     if link:
         return f"link:{link}"
     return None
@@ -309,54 +375,75 @@ def _post_identity_key(post_dict: dict) -> str | None:
 
 def _post_activity_dt(post_dict: dict) -> datetime | None:
     """Return the most recent activity datetime for a post dict."""
-    api_data = post_dict.get("api_data") if isinstance(post_dict.get("api_data"), dict) else {}
-    candidates = [
-        api_data.get("edited_at"),
-        api_data.get("updated_at"),
-        post_dict.get("edited_at"),
-        post_dict.get("updated_at"),
-        api_data.get("published_at"),
-        post_dict.get("published_at"),
-        post_dict.get("date"),
-    ]
-    dts = [dt for dt in (parse_date(v) for v in candidates) if dt is not None]
-    return max(dts) if dts else None
+    api_data = post_dict.get(_K_API_DATA)
+    if not isinstance(api_data, dict):
+        api_data = {}
+    candidates = (
+        api_data.get(_K_EDITED_AT),
+        api_data.get(_K_UPDATED_AT),
+        post_dict.get(_K_EDITED_AT),
+        post_dict.get(_K_UPDATED_AT),
+        api_data.get(_K_PUBLISHED_AT),
+        post_dict.get(_K_PUBLISHED_AT),
+        post_dict.get(_K_DATE),
+    )
+    # Canonical "YYYY-MM-DDTHH:MM:SSZ" strings order lexicographically by
+    # chronology, so when every candidate has that shape (the normal case for
+    # a DEV feed) only the maximum needs parsing. The shape check must be the
+    # strict one: a lax match could let a malformed string win max() over a
+    # valid later timestamp. If the winner still fails to parse (e.g. month
+    # 13), fall through so another candidate can be recovered.
+    present = [v for v in candidates if v]
+    if present and all(isinstance(v, str) and _CANON_Z.fullmatch(v) for v in present):
+        parsed = parse_date(max(present))
+        if parsed is not None:
+            return parsed
+
+    # Single generator pass; no intermediate list of parsed datetimes.
+    return max((dt for dt in map(parse_date, candidates) if dt is not None), default=None)
+
+
+_MERGEABLE_FIELDS = (
+    "title",
+    "link",
+    "date",
+    "content_html",
+    "description",
+    "slug",
+    "cover_image",
+    "tags",
+    "author",
+    "id",
+)
 
 
 def _merge_post_dicts(*, primary: dict, secondary: dict) -> dict:
     """Merge missing fields from secondary into primary (primary wins)."""
-    merged = dict(primary)
-    for field in (
-        "title",
-        "link",
-        "date",
-        "content_html",
-        "description",
-        "slug",
-        "cover_image",
-        "tags",
-        "author",
-        "id",
-    ):
+    # C-level dict unpacking does the bulk of the merge; the loop below only
+    # restores secondary values where primary carried an empty placeholder,
+    # so "primary wins" still means "first truthy value" per field.
+    merged = {**secondary, **primary}
+    for field in _MERGEABLE_FIELDS:
         if not merged.get(field) and secondary.get(field):
             merged[field] = secondary[field]
 
     # Merge api_data shallowly; primary wins on conflicts.
-    primary_api = primary.get("api_data") if isinstance(primary.get("api_data"), dict) else {}
-    secondary_api = secondary.get("api_data") if isinstance(secondary.get("api_data"), dict) else {}
-    merged_api = dict(secondary_api)
-    merged_api.update(primary_api)
-    merged["api_data"] = merged_api
+    primary_api = primary.get(_K_API_DATA)
+    if not isinstance(primary_api, dict):
+        primary_api = {}
+    secondary_api = secondary.get(_K_API_DATA)
+    if not isinstance(secondary_api, dict):
+        secondary_api = {}
+    merged[_K_API_DATA] = {**secondary_api, **primary_api}
     return merged
 
 
 def _post_date_sort_key(p: dict) -> datetime:
     """Sort key for posts: most recent activity first, with UTC fallback."""
-    fallback = datetime.min.replace(tzinfo=timezone.utc)
-    return _post_activity_dt(p) or fallback
+    return _post_activity_dt(p) or _MIN_UTC
 
 
-def dedupe_posts_by_link(posts_list):
+def dedupe_posts_by_link(posts_list, limit=None):
     """
     Remove duplicate posts based on stable identity.
 
@@ -369,35 +456,43 @@ def dedupe_posts_by_link(posts_list):
     existing mirrored posts.
 
     Returns a list of posts sorted by the same activity timestamp (newest first).
+    When ``limit`` is given, only the newest ``limit`` posts are returned.
     """
     if not posts_list:
         return []
 
-    posts_map = {}
+    # Bind the helpers to locals; LOAD_FAST beats repeated global lookups in
+    # a loop that runs once per post on every build.
+    identity_key = _post_identity_key
+    activity_dt = _post_activity_dt
+    min_utc = _MIN_UTC
 
+    decorated = []
+    append = decorated.append
     for post in posts_list:
         post_dict = post.to_dict() if hasattr(post, "to_dict") else post
         if not isinstance(post_dict, dict):
             continue
 
-        key = _post_identity_key(post_dict)
+        key = identity_key(post_dict)
         if not key:
             continue
 
-        incoming_dt = _post_activity_dt(post_dict)
+        append((activity_dt(post_dict) or min_utc, key, post_dict))
 
+    # Sorting newest-first up front makes the first occurrence of each key the
+    # primary by construction; later duplicates merely backfill missing
+    # fields, so the per-collision "which is newer?" comparison disappears.
+    # The sort is stable, so equal timestamps keep their input order.
+    decorated.sort(key=lambda item: item[0], reverse=True)
+
+    posts_map: dict[str, dict] = {}
+    for _, key, post_dict in decorated:
         existing = posts_map.get(key)
         if existing is None:
             posts_map[key] = post_dict
-            continue
-
-        existing_dt = _post_activity_dt(existing)
-        if incoming_dt and (not existing_dt or incoming_dt > existing_dt):
-            # Incoming is newer: keep it, but don't drop missing fields.
-            posts_map[key] = _merge_post_dicts(primary=post_dict, secondary=existing)
         else:
-            # Existing stays, but it may be missing fields that incoming has.
             posts_map[key] = _merge_post_dicts(primary=existing, secondary=post_dict)
 
-    deduped = sorted(posts_map.values(), key=_post_date_sort_key, reverse=True)
-    return deduped
+    deduped = list(posts_map.values())
+    return deduped[:limit] if limit is not None else deduped
@@ -0,0 +1,16 @@
+"""Lightweight test doubles shared across test modules."""
+
+from unittest.mock import MagicMock
+
+
+class FakeSession:
+    """Minimal stand-in for ``requests.Session``.
+
+    The article fetcher only ever calls ``.get()`` and ``.close()``; a plain
+    class holding two MagicMocks skips spec'ing the full Session surface
+    while keeping the familiar mock assertion API on both attributes.
+    """
+
+    def __init__(self):
+        self.get = MagicMock()
+        self.close = MagicMock()
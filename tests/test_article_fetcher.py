@@ -5,7 +5,8 @@ import os
 import tempfile
 import unittest
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import requests
 
@@ -16,6 +17,29 @@ from devto_mirror.core.article_fetcher import (
     _try_load_cached_articles,
     fetch_all_articles_from_api,
 )
+from tests._fakes import FakeSession
+
+# Serialized once at import; these payloads are reused across several tests.
+_MIXED_ITEMS_JSON = json.dumps(
+    [
+        {"id": 1, "title": "Valid", "link": "https://dev.to/user/valid-1"},
+        "not-a-dict",
+        None,
+        {"id": 2, "title": "Also Valid", "link": "https://dev.to/user/valid-2"},
+    ]
+)
+_CACHED_ITEMS_JSON = json.dumps(
+    [
+        {"id": 1, "title": "Post A", "link": "https://dev.to/user/post-a-1"},
+        {"id": 2, "title": "Post B", "link": "https://dev.to/user/post-b-2"},
+    ]
+)
+_CACHED_POST_JSON = json.dumps([{"id": 1, "title": "Cached", "link": "https://dev.to/user/cached-1"}])
+
+
+def _resp(payload: dict) -> SimpleNamespace:
+    """Cheap stand-in for a successful requests.Response."""
+    return SimpleNamespace(json=lambda: payload, raise_for_status=lambda: None)
 
 
 class TestConvertCachedPost(unittest.TestCase):
@@ -69,134 +93,123 @@ class TestConvertCachedPost(unittest.TestCase):
 
 
 class TestTryLoadCachedArticles(unittest.TestCase):
+    @staticmethod
+    def _patch_cache_contents(contents: str):
+        """Serve ``contents`` as the cache file without touching the real filesystem."""
+        return (
+            patch.object(Path, "exists", return_value=True),
+            patch.object(Path, "read_text", return_value=contents),
+        )
+
     def test_nonexistent_path_returns_empty(self):
         result = _try_load_cached_articles(posts_data_path="/nonexistent/path/posts.json", username="user")
         self.assertEqual(result, [])
 
     def test_empty_json_array_returns_empty(self):
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False, encoding="utf-8") as f:
-            json.dump([], f)
-            fname = f.name
-        try:
-            result = _try_load_cached_articles(posts_data_path=fname, username="user")
-            self.assertEqual(result, [])
-        finally:
-            os.unlink(fname)
+        exists_patch, read_patch = self._patch_cache_contents("[]")
+        with exists_patch, read_patch:
+            result = _try_load_cached_articles(posts_data_path="posts.json", username="user")
+        self.assertEqual(result, [])
 
     def test_mixed_valid_and_invalid_items(self):
-        items = [
-            {"id": 1, "title": "Valid", "link": "https://dev.to/user/valid-1"},
-            "not-a-dict",
-            None,
-            {"id": 2, "title": "Also Valid", "link": "https://dev.to/user/valid-2"},
-        ]
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False, encoding="utf-8") as f:
-            json.dump(items, f)
-            fname = f.name
-        try:
-            result = _try_load_cached_articles(posts_data_path=fname, username="user")
-            self.assertEqual(len(result), 2)
-        finally:
-            os.unlink(fname)
+        exists_patch, read_patch = self._patch_cache_contents(_MIXED_ITEMS_JSON)
+        with exists_patch, read_patch:
+            result = _try_load_cached_articles(posts_data_path="posts.json", username="user")
+        self.assertEqual(len(result), 2)
 
     def test_invalid_json_returns_empty(self):
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False, encoding="utf-8") as f:
-            f.write("not valid json }{")
-            fname = f.name
-        try:
-            result = _try_load_cached_articles(posts_data_path=fname, username="user")
-            self.assertEqual(result, [])
-        finally:
-            os.unlink(fname)
+        exists_patch, read_patch = self._patch_cache_contents("not valid json }{")
+        with exists_patch, read_patch:
+            result = _try_load_cached_articles(posts_data_path="posts.json", username="user")
+        self.assertEqual(result, [])
 
     def test_valid_cache_converts_all(self):
-        items = [
-            {"id": 1, "title": "Post A", "link": "https://dev.to/user/post-a-1"},
-            {"id": 2, "title": "Post B", "link": "https://dev.to/user/post-b-2"},
-        ]
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False, encoding="utf-8") as f:
-            json.dump(items, f)
-            fname = f.name
-        try:
-            result = _try_load_cached_articles(posts_data_path=fname, username="user")
-            self.assertEqual(len(result), 2)
-        finally:
-            os.unlink(fname)
+        exists_patch, read_patch = self._patch_cache_contents(_CACHED_ITEMS_JSON)
+        with exists_patch, read_patch:
+            result = _try_load_cached_articles(posts_data_path="posts.json", username="user")
+        self.assertEqual(len(result), 2)
 
 
 class TestFetchFullArticleJson(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # No test here should ever actually sleep; install the patch once for
+        # the whole class and just reset call state between tests.
+        cls.mock_sleep = cls.enterClassContext(patch("devto_mirror.core.article_fetcher.time.sleep"))
+
+    def setUp(self):
+        self.mock_sleep.reset_mock()
+        self.session = FakeSession()
+
     def test_max_retries_zero_returns_none(self):
-        session = MagicMock(spec=requests.Session)
+        session = self.session
         result = _fetch_full_article_json(session, article_id=123, max_retries=0)
         self.assertIsNone(result)
         session.get.assert_not_called()
 
-    @patch("devto_mirror.core.article_fetcher.time.sleep")
-    def test_read_timeout_retries_then_fails(self, mock_sleep):
-        session = MagicMock(spec=requests.Session)
+    def test_read_timeout_retries_then_fails(self):
+        session = self.session
         session.get.side_effect = requests.exceptions.ReadTimeout("Timeout")
         result = _fetch_full_article_json(session, article_id=123, max_retries=2)
         self.assertIsNone(result)
         self.assertEqual(session.get.call_count, 2)
-        mock_sleep.assert_called_once()
+        self.mock_sleep.assert_called_once()
 
-    @patch("devto_mirror.core.article_fetcher.time.sleep")
-    def test_connection_error_retries_then_fails(self, mock_sleep):
-        session = MagicMock(spec=requests.Session)
+    def test_connection_error_retries_then_fails(self):
+        session = self.session
         session.get.side_effect = requests.exceptions.ConnectionError("Connection reset")
         result = _fetch_full_article_json(session, article_id=123, max_retries=2)
         self.assertIsNone(result)
         self.assertEqual(session.get.call_count, 2)
 
     def test_request_exception_fails_immediately_without_retry(self):
-        session = MagicMock(spec=requests.Session)
+        session = self.session
         session.get.side_effect = requests.exceptions.HTTPError("404 Not Found")
         result = _fetch_full_article_json(session, article_id=123, max_retries=3)
         self.assertIsNone(result)
         self.assertEqual(session.get.call_count, 1)
 
     def test_success_returns_json(self):
-        session = MagicMock(spec=requests.Session)
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"id": 123, "title": "Test Article"}
-        session.get.return_value = mock_response
+        session = self.session
+        session.get.return_value = _resp({"id": 123, "title": "Test Article"})
         result = _fetch_full_article_json(session, article_id=123)
         self.assertEqual(result, {"id": 123, "title": "Test Article"})
 
-    @patch("devto_mirror.core.article_fetcher.time.sleep")
-    def test_timeout_then_success(self, mock_sleep):
-        session = MagicMock(spec=requests.Session)
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"id": 123, "title": "Test"}
+    def test_timeout_then_success(self):
+        session = self.session
         session.get.side_effect = [
             requests.exceptions.ReadTimeout("Timeout"),
-            mock_response,
+            _resp({"id": 123, "title": "Test"}),
         ]
         result = _fetch_full_article_json(session, article_id=123, max_retries=3)
         self.assertEqual(result, {"id": 123, "title": "Test"})
-        mock_sleep.assert_called_once()
+        self.mock_sleep.assert_called_once()
 
-    @patch("devto_mirror.core.article_fetcher.time.sleep")
-    def test_exponential_backoff(self, mock_sleep):
-        session = MagicMock(spec=requests.Session)
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"id": 1}
+    def test_exponential_backoff(self):
+        session = self.session
         session.get.side_effect = [
             requests.exceptions.ReadTimeout("T1"),
             requests.exceptions.ReadTimeout("T2"),
-            mock_response,
+            _resp({"id": 1}),
         ]
         _fetch_full_article_json(session, article_id=1, max_retries=3, initial_retry_delay=2)
         # First sleep=2, second sleep=4
-        self.assertEqual(mock_sleep.call_args_list[0][0][0], 2)
-        self.assertEqual(mock_sleep.call_args_list[1][0][0], 4)
+        self.assertEqual(self.mock_sleep.call_args_list[0][0][0], 2)
+        self.assertEqual(self.mock_sleep.call_args_list[1][0][0], 4)
 
 
 class TestFetchFullArticles(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.mock_sleep = cls.enterClassContext(patch("devto_mirror.core.article_fetcher.time.sleep"))
+
+    def setUp(self):
+        self.mock_sleep.reset_mock()
+        self.session = FakeSession()
+
     @patch("devto_mirror.core.article_fetcher.create_devto_session")
-    @patch("devto_mirror.core.article_fetcher.time.sleep")
-    def test_session_created_and_closed(self, mock_sleep, mock_create_session):
-        mock_session = MagicMock(spec=requests.Session)
+    def test_session_created_and_closed(self, mock_create_session):
+        mock_session = self.session
         mock_create_session.return_value = mock_session
         with patch("devto_mirror.core.article_fetcher._fetch_full_article_json", return_value={"id": 1}):
             full, _failed = _fetch_full_articles(article_summaries=[{"id": 1}])
@@ -204,9 +217,8 @@ class TestFetchFullArticles(unittest.TestCase):
         self.assertEqual(len(full), 1)
 
     @patch("devto_mirror.core.article_fetcher.create_devto_session")
-    @patch("devto_mirror.core.article_fetcher.time.sleep")
-    def test_failed_articles_tracked(self, mock_sleep, mock_create_session):
-        mock_session = MagicMock(spec=requests.Session)
+    def test_failed_articles_tracked(self, mock_create_session):
+        mock_session = self.session
         mock_create_session.return_value = mock_session
         with patch("devto_mirror.core.article_fetcher._fetch_full_article_json") as mock_fetch:
             mock_fetch.side_effect = [{"id": 1, "title": "Success"}, None]
@@ -218,20 +230,16 @@ class TestFetchFullArticles(unittest.TestCase):
     @patch("devto_mirror.core.article_fetcher.create_devto_session")
     def test_single_article_no_sleep_between(self, mock_create_session):
         """With only one article, no sleep should be called between articles."""
-        mock_session = MagicMock(spec=requests.Session)
+        mock_session = self.session
         mock_create_session.return_value = mock_session
-        with (
-            patch("devto_mirror.core.article_fetcher._fetch_full_article_json", return_value={"id": 1}),
-            patch("devto_mirror.core.article_fetcher.time.sleep") as mock_sleep,
-        ):
+        with patch("devto_mirror.core.article_fetcher._fetch_full_article_json", return_value={"id": 1}):
             full, _failed = _fetch_full_articles(article_summaries=[{"id": 1}])
-        mock_sleep.assert_not_called()
+        self.mock_sleep.assert_not_called()
         self.assertEqual(len(full), 1)
 
     @patch("devto_mirror.core.article_fetcher.create_devto_session")
-    @patch("devto_mirror.core.article_fetcher.time.sleep")
-    def test_sleep_between_multiple_articles(self, mock_sleep, mock_create_session):
-        mock_session = MagicMock(spec=requests.Session)
+    def test_sleep_between_multiple_articles(self, mock_create_session):
+        mock_session = self.session
         mock_create_session.return_value = mock_session
         with patch(
             "devto_mirror.core.article_fetcher._fetch_full_article_json",
@@ -239,76 +247,70 @@ class TestFetchFullArticles(unittest.TestCase):
         ):
             _fetch_full_articles(article_summaries=[{"id": 1}, {"id": 2}])
         # Sleep called once between articles (not after the last one)
-        self.assertEqual(mock_sleep.call_count, 1)
-        mock_sleep.assert_called_with(0.8)
+        self.assertEqual(self.mock_sleep.call_count, 1)
+        self.mock_sleep.assert_called_with(0.8)
 
 
 class TestFetchAllArticlesFromApi(unittest.TestCase):
-    @patch.dict("os.environ", {"DEVTO_MIRROR_FORCE_EMPTY_FEED": "true"})
-    def test_force_empty_feed_with_last_run(self):
-        with tempfile.TemporaryDirectory() as td:
-            result = fetch_all_articles_from_api(
-                username="testuser",
-                last_run_iso="2025-01-01T00:00:00+00:00",
-                posts_data_path=Path(td) / "posts_data.json",
-                validation_mode=False,
-            )
-        self.assertTrue(result.success)
-        self.assertTrue(result.no_new_posts)
-        self.assertEqual(result.source, "forced-empty")
-        self.assertEqual(result.articles, [])
-
-    @patch.dict("os.environ", {"DEVTO_MIRROR_FORCE_EMPTY_FEED": "1"})
-    def test_force_empty_feed_without_last_run(self):
-        with tempfile.TemporaryDirectory() as td:
-            result = fetch_all_articles_from_api(
-                username="testuser",
-                last_run_iso=None,
-                posts_data_path=Path(td) / "posts_data.json",
-                validation_mode=False,
-            )
-        self.assertFalse(result.no_new_posts)
-        self.assertEqual(result.source, "forced-empty")
-
-    @patch.dict("os.environ", {"DEVTO_MIRROR_FORCE_EMPTY_FEED": "yes"})
-    def test_force_empty_feed_yes_value(self):
-        with tempfile.TemporaryDirectory() as td:
-            result = fetch_all_articles_from_api(
-                username="testuser",
-                last_run_iso=None,
-                posts_data_path=Path(td) / "posts_data.json",
-                validation_mode=False,
-            )
-        self.assertEqual(result.source, "forced-empty")
+    @classmethod
+    def setUpClass(cls):
+        # One shared tempdir for the class; per-test file names keep tests isolated.
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.td = cls._tmp.name
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
+    def _posts_path(self) -> Path:
+        # Keyed off the fully qualified test id so tests stay collision-free
+        # even when the suite is run in parallel.
+        return Path(self.td) / f"{self.id()}.json"
+
+    def test_force_empty_feed_accepted_values(self):
+        cases = [
+            ("true", "2025-01-01T00:00:00+00:00", True),
+            ("1", None, False),
+            ("yes", None, False),
+        ]
+        for value, last_run_iso, expect_no_new in cases:
+            with self.subTest(value=value):
+                with patch.dict("os.environ", {"DEVTO_MIRROR_FORCE_EMPTY_FEED": value}):
+                    result = fetch_all_articles_from_api(
+                        username="testuser",
+                        last_run_iso=last_run_iso,
+                        posts_data_path=self._posts_path(),
+                        validation_mode=False,
+                    )
+                self.assertTrue(result.success)
+                self.assertEqual(result.no_new_posts, expect_no_new)
+                self.assertEqual(result.source, "forced-empty")
+                self.assertEqual(result.articles, [])
 
     @patch.dict("os.environ", {"VALIDATION_NO_POSTS": "true"})
     def test_validation_no_posts_env_var(self):
-        with tempfile.TemporaryDirectory() as td:
-            result = fetch_all_articles_from_api(
-                username="testuser",
-                last_run_iso=None,
-                posts_data_path=Path(td) / "posts_data.json",
-                validation_mode=True,
-            )
+        result = fetch_all_articles_from_api(
+            username="testuser",
+            last_run_iso=None,
+            posts_data_path=self._posts_path(),
+            validation_mode=True,
+        )
         self.assertTrue(result.success)
         self.assertEqual(result.articles, [])
         self.assertEqual(result.source, "validation")
         self.assertFalse(result.no_new_posts)
 
     def test_validation_mode_returns_mock_article(self):
-        old_env = os.environ.copy()
-        try:
+        # patch.dict with no changes snapshots the environment so the pop
+        # below is undone on exit.
+        with patch.dict("os.environ"):
             os.environ.pop("VALIDATION_NO_POSTS", None)
-            with tempfile.TemporaryDirectory() as td:
-                result = fetch_all_articles_from_api(
-                    username="testuser",
-                    last_run_iso=None,
-                    posts_data_path=Path(td) / "posts_data.json",
-                    validation_mode=True,
-                )
-        finally:
-            os.environ.clear()
-            os.environ.update(old_env)
+            result = fetch_all_articles_from_api(
+                username="testuser",
+                last_run_iso=None,
+                posts_data_path=self._posts_path(),
+                validation_mode=True,
+            )
         self.assertTrue(result.success)
         self.assertEqual(len(result.articles), 1)
         self.assertEqual(result.source, "mock")
@@ -317,26 +319,24 @@ class TestFetchAllArticlesFromApi(unittest.TestCase):
     @patch("devto_mirror.core.article_fetcher._fetch_article_pages")
     def test_no_summaries_with_last_run_iso_returns_no_new(self, mock_fetch_pages):
         mock_fetch_pages.return_value = []
-        with tempfile.TemporaryDirectory() as td:
-            result = fetch_all_articles_from_api(
-                username="testuser",
-                last_run_iso="2025-01-01T00:00:00+00:00",
-                posts_data_path=Path(td) / "posts_data.json",
-                validation_mode=False,
-            )
+        result = fetch_all_articles_from_api(
+            username="testuser",
+            last_run_iso="2025-01-01T00:00:00+00:00",
+            posts_data_path=self._posts_path(),
+            validation_mode=False,
+        )
         self.assertTrue(result.no_new_posts)
         self.assertEqual(result.source, "api")
 
     @patch("devto_mirror.core.article_fetcher._fetch_article_pages")
     def test_no_summaries_without_last_run_iso(self, mock_fetch_pages):
         mock_fetch_pages.return_value = []
-        with tempfile.TemporaryDirectory() as td:
-            result = fetch_all_articles_from_api(
-                username="testuser",
-                last_run_iso=None,
-                posts_data_path=Path(td) / "posts_data.json",
-                validation_mode=False,
-            )
+        result = fetch_all_articles_from_api(
+            username="testuser",
+            last_run_iso=None,
+            posts_data_path=self._posts_path(),
+            validation_mode=False,
+        )
         self.assertFalse(result.no_new_posts)
         self.assertEqual(result.source, "api")
 
@@ -345,18 +345,14 @@ class TestFetchAllArticlesFromApi(unittest.TestCase):
     def test_fallback_to_cache_when_full_articles_empty(self, mock_full, mock_pages):
         mock_pages.return_value = [{"id": 1}]
         mock_full.return_value = ([], [{"id": 1}])
-        with tempfile.TemporaryDirectory() as td:
-            posts_path = Path(td) / "posts_data.json"
-            posts_path.write_text(
-                json.dumps([{"id": 1, "title": "Cached", "link": "https://dev.to/user/cached-1"}]),
-                encoding="utf-8",
-            )
-            result = fetch_all_articles_from_api(
-                username="testuser",
-                last_run_iso=None,
-                posts_data_path=posts_path,
-                validation_mode=False,
-            )
+        posts_path = self._posts_path()
+        posts_path.write_text(_CACHED_POST_JSON, encoding="utf-8")
+        result = fetch_all_articles_from_api(
+            username="testuser",
+            last_run_iso=None,
+            posts_data_path=posts_path,
+            validation_mode=False,
+        )
         self.assertFalse(result.success)
         self.assertEqual(result.source, "cache")
         self.assertTrue(result.articles)
@@ -366,18 +362,14 @@ class TestFetchAllArticlesFromApi(unittest.TestCase):
     def test_fallback_to_cache_on_exception(self, mock_full, mock_pages):
         mock_pages.return_value = [{"id": 1}]
         mock_full.side_effect = Exception("Network error")
-        with tempfile.TemporaryDirectory() as td:
-            posts_path = Path(td) / "posts_data.json"
-            posts_path.write_text(
-                json.dumps([{"id": 1, "title": "Cached", "link": "https://dev.to/user/cached-1"}]),
-                encoding="utf-8",
-            )
-            result = fetch_all_articles_from_api(
-                username="testuser",
-                last_run_iso=None,
-                posts_data_path=posts_path,
-                validation_mode=False,
-            )
+        posts_path = self._posts_path()
+        posts_path.write_text(_CACHED_POST_JSON, encoding="utf-8")
+        result = fetch_all_articles_from_api(
+            username="testuser",
+            last_run_iso=None,
+            posts_data_path=posts_path,
+            validation_mode=False,
+        )
         self.assertFalse(result.success)
         self.assertEqual(result.source, "cache")
 
@@ -386,13 +378,12 @@ class TestFetchAllArticlesFromApi(unittest.TestCase):
     def test_success_returns_full_articles(self, mock_full, mock_pages):
         mock_pages.return_value = [{"id": 1}]
         mock_full.return_value = ([{"id": 1, "title": "Full Article"}], [])
-        with tempfile.TemporaryDirectory() as td:
-            result = fetch_all_articles_from_api(
-                username="testuser",
-                last_run_iso=None,
-                posts_data_path=Path(td) / "posts_data.json",
-                validation_mode=False,
-            )
+        result = fetch_all_articles_from_api(
+            username="testuser",
+            last_run_iso=None,
+            posts_data_path=self._posts_path(),
+            validation_mode=False,
+        )
         self.assertTrue(result.success)
         self.assertEqual(result.source, "api")
         self.assertEqual(result.articles[0]["title"], "Full Article")
@@ -403,13 +394,12 @@ class TestFetchAllArticlesFromApi(unittest.TestCase):
         """When cache file doesn't exist, fallback returns empty articles list."""
         mock_pages.return_value = [{"id": 1}]
         mock_full.return_value = ([], [{"id": 1}])
-        with tempfile.TemporaryDirectory() as td:
-            result = fetch_all_articles_from_api(
-                username="testuser",
-                last_run_iso=None,
-                posts_data_path=Path(td) / "posts_data.json",
-                validation_mode=False,
-            )
+        result = fetch_all_articles_from_api(
+            username="testuser",
+            last_run_iso=None,
+            posts_data_path=self._posts_path(),
+            validation_mode=False,
+        )
         self.assertFalse(result.success)
         self.assertEqual(result.source, "cache")
         self.assertEqual(result.articles, [])
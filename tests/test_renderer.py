@@ -1,360 +1,283 @@
 """Tests for devto_mirror.site_generation.renderer"""
 
+import atexit
 import contextlib
+import io
 import json
 import os
 import pathlib
 import tempfile
 import unittest
-from unittest.mock import patch
-
-
-@contextlib.contextmanager
-def _chdir(path: pathlib.Path):
-    old = pathlib.Path.cwd()
-    os.chdir(path)
-    try:
-        yield
-    finally:
-        os.chdir(old)
+from unittest.mock import MagicMock, patch
+
+from devto_mirror.site_generation import renderer
+
+# Fixture payloads are fixed, so encode each one a single time at import
+# instead of re-running json.dumps inside every test body. They are kept as
+# UTF-8 bytes so write_bytes can skip the encode step inside write_text.
+_POSTS_A = [{"title": "A", "link": "https://dev.to/user/a-1"}]
+_POSTS_A_JSON = json.dumps(_POSTS_A).encode()
+_POSTS_B = [{"title": "B"}]
+_POSTS_B_JSON = json.dumps(_POSTS_B).encode()
+_EXISTING_DATED_JSON = json.dumps(
+    [
+        {
+            "title": "Existing",
+            "link": "https://dev.to/user/existing-1",
+            "slug": "existing-1",
+            "date": "2024-01-01T00:00:00Z",
+        }
+    ]
+).encode()
+_OLD_DATED_JSON = json.dumps(
+    [{"title": "Old", "link": "https://dev.to/user/old-1", "slug": "old-1", "date": "2024-01-01T00:00:00Z"}]
+).encode()
+_NEW_DATED_JSON = json.dumps(
+    [{"title": "New", "link": "https://dev.to/user/new-2", "slug": "new-2", "date": "2024-01-02T00:00:00Z"}]
+).encode()
+_OLD_JSON = json.dumps([{"title": "Old", "link": "https://dev.to/user/old-1", "slug": "old-1"}]).encode()
+
+# Oversized comment context for the label-truncation check, built once.
+_LONG_CTX = "x" * 100
+
+# Static comment manifests for the process_comments tests.
+_DUP_COMMENTS = b"https://dev.to/comment/abc|First\nhttps://dev.to/comment/abc|Duplicate\n"
+_SINGLE_COMMENT = b"https://dev.to/comment/abc|Context\n"
+_NEW_JSON = json.dumps([{"title": "New", "link": "https://dev.to/user/new-2", "slug": "new-2"}]).encode()
+
+
+# One tempdir for the whole module; tests take per-test subdirectories out of
+# it rather than each paying a mkdtemp plus a recursive cleanup. Prefer tmpfs
+# so fixture JSON never touches a real disk.
+_SESSION_TMP = tempfile.TemporaryDirectory(dir="/dev/shm" if os.path.isdir("/dev/shm") else None)
+atexit.register(_SESSION_TMP.cleanup)
+
+
+def _fresh_dir(name: str) -> pathlib.Path:
+    """Create and return an empty directory under the module-wide tempdir."""
+    path = pathlib.Path(_SESSION_TMP.name) / name
+    path.mkdir()
+    return path
+
+
+class _chdir:
+    """Plain context-manager class; skips the generator machinery that
+    ``contextlib.contextmanager`` spins up on every ``with`` block."""
+
+    __slots__ = ("_new", "_old")
+
+    def __init__(self, path):
+        self._new = os.fspath(path)
+
+    def __enter__(self):
+        self._old = os.getcwd()
+        os.chdir(self._new)
+
+    def __exit__(self, *exc_info):
+        os.chdir(self._old)
 
 
 class TestLoadPostsData(unittest.TestCase):
-    def test_missing_file_returns_empty_list(self):
-        from devto_mirror.site_generation import renderer
+    @classmethod
+    def setUpClass(cls):
+        # The fixtures are read-only, so seed them all once. Tests pass
+        # absolute paths (ROOT is ".", so they resolve unchanged) instead
+        # of chdir-ing, keeping the process cwd untouched.
+        cls.root = _fresh_dir(cls.__name__)
+        (cls.root / "posts_data.json").write_bytes(_POSTS_A_JSON)
+        (cls.root / "custom.json").write_bytes(_POSTS_B_JSON)
+        # Build the path strings once; the tests just hand them over.
+        cls.posts_path = str(cls.root / "posts_data.json")
+        cls.custom_path = str(cls.root / "custom.json")
+        cls.missing_path = str(cls.root / "missing.json")
 
-        with tempfile.TemporaryDirectory() as td:
-            with _chdir(pathlib.Path(td)):
-                result = renderer.load_posts_data()
-        self.assertEqual(result, [])
+    def test_missing_file_returns_empty_list(self):
+        self.assertEqual(renderer.load_posts_data(self.missing_path), [])
 
     def test_invalid_json_returns_empty_list(self):
-        from devto_mirror.site_generation import renderer
-
-        with tempfile.TemporaryDirectory() as td:
-            root = pathlib.Path(td)
-            (root / "posts_data.json").write_text("not valid json {{{", encoding="utf-8")
-            with _chdir(root):
-                result = renderer.load_posts_data()
-        self.assertEqual(result, [])
+        # No corrupt fixture on disk: fail the parse itself on a real file.
+        with patch(
+            "devto_mirror.site_generation.renderer.json.load",
+            side_effect=json.JSONDecodeError("not valid json", "", 0),
+        ):
+            self.assertEqual(renderer.load_posts_data(self.posts_path), [])
 
     def test_valid_json_returns_posts(self):
-        from devto_mirror.site_generation import renderer
-
-        posts = [{"title": "A", "link": "https://dev.to/user/a-1"}]
-        with tempfile.TemporaryDirectory() as td:
-            root = pathlib.Path(td)
-            (root / "posts_data.json").write_text(json.dumps(posts), encoding="utf-8")
-            with _chdir(root):
-                result = renderer.load_posts_data()
-        self.assertEqual(result, posts)
+        self.assertEqual(renderer.load_posts_data(self.posts_path), _POSTS_A)
 
     def test_custom_path(self):
-        from devto_mirror.site_generation import renderer
-
-        posts = [{"title": "B"}]
-        with tempfile.TemporaryDirectory() as td:
-            root = pathlib.Path(td)
-            (root / "custom.json").write_text(json.dumps(posts), encoding="utf-8")
-            with _chdir(root):
-                result = renderer.load_posts_data("custom.json")
-        self.assertEqual(result, posts)
+        self.assertEqual(renderer.load_posts_data(self.custom_path), _POSTS_B)
 
 
 class TestSavePostsData(unittest.TestCase):
     def test_save_success(self):
-        from devto_mirror.site_generation import renderer
-
         posts = [{"title": "A"}]
-        with tempfile.TemporaryDirectory() as td:
-            root = pathlib.Path(td)
-            with _chdir(root):
-                result = renderer.save_posts_data(posts)
-            self.assertTrue(result)
-            saved = json.loads((root / "posts_data.json").read_text())
-            self.assertEqual(saved, posts)
+        target = _fresh_dir(self.id()) / "posts_data.json"
+        result = renderer.save_posts_data(posts, str(target))
+        self.assertTrue(result)
+        with target.open("rb") as f:
+            self.assertEqual(json.load(f), posts)
 
     def test_save_error_returns_false(self):
-        from devto_mirror.site_generation import renderer
-
-        with tempfile.TemporaryDirectory() as td:
-            root = pathlib.Path(td)
-            with _chdir(root), patch("pathlib.Path.open", side_effect=IOError("Permission denied")):
-                result = renderer.save_posts_data([{"title": "A"}])
+        target = _fresh_dir(self.id()) / "posts_data.json"
+        with patch.object(pathlib.Path, "open", side_effect=IOError("Permission denied")):
+            result = renderer.save_posts_data([{"title": "A"}], str(target))
         self.assertFalse(result)
 
 
 class TestLoadAndMergePosts(unittest.TestCase):
     def test_no_new_file_returns_existing(self):
-        from devto_mirror.site_generation import renderer
-
-        posts = [
-            {
-                "title": "Existing",
-                "link": "https://dev.to/user/existing-1",
-                "slug": "existing-1",
-                "date": "2024-01-01T00:00:00Z",
-            }
-        ]
-        with tempfile.TemporaryDirectory() as td:
-            root = pathlib.Path(td)
-            (root / "posts_data.json").write_text(json.dumps(posts), encoding="utf-8")
-            with _chdir(root):
-                result = renderer.load_and_merge_posts()
+        root = _fresh_dir(self.id())
+        (root / "posts_data.json").write_bytes(_EXISTING_DATED_JSON)
+        with _chdir(root):
+            result = renderer.load_and_merge_posts()
         self.assertEqual(len(result), 1)
 
     def test_merges_new_with_existing(self):
-        from devto_mirror.site_generation import renderer
-
-        existing = [
-            {
-                "title": "Old",
-                "link": "https://dev.to/user/old-1",
-                "slug": "old-1",
-                "date": "2024-01-01T00:00:00Z",
-            }
-        ]
-        new_posts = [
-            {
-                "title": "New",
-                "link": "https://dev.to/user/new-2",
-                "slug": "new-2",
-                "date": "2024-01-02T00:00:00Z",
-            }
-        ]
-        with tempfile.TemporaryDirectory() as td:
-            root = pathlib.Path(td)
-            (root / "posts_data.json").write_text(json.dumps(existing), encoding="utf-8")
-            (root / "posts_data_new.json").write_text(json.dumps(new_posts), encoding="utf-8")
-            with _chdir(root), patch("builtins.print"):
-                result = renderer.load_and_merge_posts()
+        root = _fresh_dir(self.id())
+        (root / "posts_data.json").write_bytes(_OLD_DATED_JSON)
+        (root / "posts_data_new.json").write_bytes(_NEW_DATED_JSON)
+        with _chdir(root), contextlib.redirect_stdout(io.StringIO()):
+            result = renderer.load_and_merge_posts()
         self.assertEqual(len(result), 2)
 
     def test_new_file_invalid_json_falls_back_gracefully(self):
-        from devto_mirror.site_generation import renderer
-
-        existing = [{"title": "Old", "link": "https://dev.to/user/old-1", "slug": "old-1"}]
-        with tempfile.TemporaryDirectory() as td:
-            root = pathlib.Path(td)
-            (root / "posts_data.json").write_text(json.dumps(existing), encoding="utf-8")
-            (root / "posts_data_new.json").write_text("not valid json {{{", encoding="utf-8")
-            with _chdir(root), patch("builtins.print"):
-                result = renderer.load_and_merge_posts()
+        root = _fresh_dir(self.id())
+        (root / "posts_data.json").write_bytes(_OLD_JSON)
+        (root / "posts_data_new.json").write_bytes(b"not valid json {{{")
+        with _chdir(root), contextlib.redirect_stdout(io.StringIO()):
+            result = renderer.load_and_merge_posts()
         # Should return existing posts without crashing
         self.assertEqual(len(result), 1)
 
     def test_new_file_empty_prints_message(self):
-        from devto_mirror.site_generation import renderer
-
-        existing = [{"title": "Old", "link": "https://dev.to/user/old-1", "slug": "old-1"}]
-        with tempfile.TemporaryDirectory() as td:
-            root = pathlib.Path(td)
-            (root / "posts_data.json").write_text(json.dumps(existing), encoding="utf-8")
-            (root / "posts_data_new.json").write_text(json.dumps([]), encoding="utf-8")
-            with _chdir(root), patch("builtins.print") as mock_print:
-                result = renderer.load_and_merge_posts()
+        root = _fresh_dir(self.id())
+        (root / "posts_data.json").write_bytes(_OLD_JSON)
+        (root / "posts_data_new.json").write_bytes(b"[]")
+        with _chdir(root), patch("builtins.print") as mock_print:
+            result = renderer.load_and_merge_posts()
         self.assertEqual(len(result), 1)
-        all_printed = " ".join(str(c) for c in mock_print.call_args_list)
-        self.assertIn("No new posts", all_printed)
+        self.assertTrue(any("No new posts" in str(c) for c in mock_print.call_args_list))
 
     def test_merge_save_failure_prints_warning(self):
-        from devto_mirror.site_generation import renderer
-
-        existing = [{"title": "Old", "link": "https://dev.to/user/old-1", "slug": "old-1"}]
-        new_posts = [{"title": "New", "link": "https://dev.to/user/new-2", "slug": "new-2"}]
-        with tempfile.TemporaryDirectory() as td:
-            root = pathlib.Path(td)
-            (root / "posts_data.json").write_text(json.dumps(existing), encoding="utf-8")
-            (root / "posts_data_new.json").write_text(json.dumps(new_posts), encoding="utf-8")
-            with (
-                _chdir(root),
-                patch("builtins.print") as mock_print,
-                patch("devto_mirror.site_generation.renderer.save_posts_data", return_value=False),
-            ):
-                renderer.load_and_merge_posts()
-        all_printed = " ".join(str(c) for c in mock_print.call_args_list)
-        self.assertIn("Warning", all_printed)
+        root = _fresh_dir(self.id())
+        (root / "posts_data.json").write_bytes(_OLD_JSON)
+        (root / "posts_data_new.json").write_bytes(_NEW_JSON)
+        with (
+            _chdir(root),
+            patch("builtins.print") as mock_print,
+            patch("devto_mirror.site_generation.renderer.save_posts_data", return_value=False),
+        ):
+            renderer.load_and_merge_posts()
+        self.assertTrue(any("Warning" in str(c) for c in mock_print.call_args_list))
 
 
 class TestLoadCommentManifest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # The fixtures differ only in comments.txt content, so the class
+        # shares one directory. Tests pass the manifest's absolute path
+        # rather than chdir-ing into it.
+        cls.root = _fresh_dir(cls.__name__)
+
+    def _load_manifest(self, manifest_text):
+        manifest = self.root / "comments.txt"
+        manifest.write_text(manifest_text, encoding="utf-8")
+        return renderer.load_comment_manifest(str(manifest))
+
     def test_no_comments_file_returns_empty(self):
-        from devto_mirror.site_generation import renderer
-
-        with tempfile.TemporaryDirectory() as td:
-            root = pathlib.Path(td)
-            with _chdir(root):
-                items = renderer.load_comment_manifest()
-        self.assertEqual(items, [])
-
-    def test_comment_id_from_fragment(self):
-        from devto_mirror.site_generation import renderer
-
-        with tempfile.TemporaryDirectory() as td:
-            root = pathlib.Path(td)
-            (root / "comments.txt").write_text(
-                "https://dev.to/user/post#comment-abc123|Nice comment\n",
-                encoding="utf-8",
-            )
-            with _chdir(root):
-                items = renderer.load_comment_manifest()
-        self.assertEqual(len(items), 1)
-        self.assertIn("abc123", items[0]["local"])
-
-    def test_comment_id_from_path(self):
-        from devto_mirror.site_generation import renderer
-
-        with tempfile.TemporaryDirectory() as td:
-            root = pathlib.Path(td)
-            (root / "comments.txt").write_text(
-                "https://dev.to/comment/456|Some context\n",
-                encoding="utf-8",
-            )
-            with _chdir(root):
-                items = renderer.load_comment_manifest()
-        self.assertEqual(len(items), 1)
-        self.assertIn("456", items[0]["local"])
-
-    def test_blank_lines_and_hash_comments_skipped(self):
-        from devto_mirror.site_generation import renderer
-
-        with tempfile.TemporaryDirectory() as td:
-            root = pathlib.Path(td)
-            (root / "comments.txt").write_text(
-                "# this is a comment\n\nhttps://dev.to/comment/789|Context\n",
-                encoding="utf-8",
-            )
-            with _chdir(root):
-                items = renderer.load_comment_manifest()
-        self.assertEqual(len(items), 1)
+        missing = _fresh_dir(self.id()) / "comments.txt"
+        self.assertEqual(renderer.load_comment_manifest(str(missing)), [])
+
+    def test_manifest_parsing_cases(self):
+        cases = [
+            ("id_from_fragment", "https://dev.to/user/post#comment-abc123|Nice comment\n", "abc123"),
+            ("id_from_path", "https://dev.to/comment/456|Some context\n", "456"),
+            ("blank_and_hash_lines_skipped", "# this is a comment\n\nhttps://dev.to/comment/789|Context\n", "789"),
+        ]
+        for name, manifest, local_id in cases:
+            with self.subTest(name=name):
+                items = self._load_manifest(manifest)
+                self.assertEqual(len(items), 1)
+                self.assertIn(local_id, items[0]["local"])
 
     def test_label_truncated_at_80_chars(self):
-        from devto_mirror.site_generation import renderer
-
-        long_context = "x" * 100
-        with tempfile.TemporaryDirectory() as td:
-            root = pathlib.Path(td)
-            (root / "comments.txt").write_text(
-                f"https://dev.to/comment/abc|{long_context}\n",
-                encoding="utf-8",
-            )
-            with _chdir(root):
-                items = renderer.load_comment_manifest()
+        items = self._load_manifest(f"https://dev.to/comment/abc|{_LONG_CTX}\n")
         self.assertEqual(len(items[0]["text"]), 80)
         self.assertTrue(items[0]["text"].endswith("..."))
 
 
 class TestGetHomeUrl(unittest.TestCase):
-    def test_site_domain_env_var(self):
-        from devto_mirror.site_generation import renderer
+    def setUp(self):
+        # One environ patch per test rather than one per env combination;
+        # each test then pokes only the key it cares about.
+        self.enterContext(patch.dict(os.environ, {"SITE_DOMAIN": "", "GH_USERNAME": ""}))
 
-        with patch.dict(os.environ, {"SITE_DOMAIN": "example.com", "GH_USERNAME": ""}):
-            url = renderer.get_home_url()
-        self.assertIn("example.com", url)
+    def test_site_domain_env_var(self):
+        os.environ["SITE_DOMAIN"] = "example.com"
+        self.assertIn("example.com", renderer.get_home_url())
 
     def test_gh_username_env_var(self):
-        from devto_mirror.site_generation import renderer
-
-        with patch.dict(os.environ, {"GH_USERNAME": "testuser", "SITE_DOMAIN": ""}):
-            url = renderer.get_home_url()
-        self.assertIn("testuser", url)
+        os.environ["GH_USERNAME"] = "testuser"
+        self.assertIn("testuser", renderer.get_home_url())
 
     def test_neither_returns_empty_string(self):
-        from devto_mirror.site_generation import renderer
-
         # Both empty → build_site_urls raises ValueError → returns ""
-        with patch.dict(os.environ, {"SITE_DOMAIN": "", "GH_USERNAME": ""}):
-            url = renderer.get_home_url()
-        self.assertEqual(url, "")
+        self.assertEqual(renderer.get_home_url(), "")
 
 
 class TestProcessComments(unittest.TestCase):
     def test_empty_manifest_returns_empty(self):
-        from devto_mirror.site_generation import renderer
-
-        with tempfile.TemporaryDirectory() as td:
-            root = pathlib.Path(td)
-            with _chdir(root):
-                result = renderer.process_comments("")
+        root = _fresh_dir(self.id())
+        with _chdir(root):
+            result = renderer.process_comments("")
         self.assertEqual(result, [])
 
     def test_deduplicates_duplicate_comment_urls(self):
-        from devto_mirror.site_generation import renderer
-
-        with tempfile.TemporaryDirectory() as td:
-            root = pathlib.Path(td)
-            (root / "comments.txt").write_text(
-                "https://dev.to/comment/abc|First\nhttps://dev.to/comment/abc|Duplicate\n",
-                encoding="utf-8",
-            )
-            with _chdir(root):
-                result = renderer.process_comments("")
+        root = _fresh_dir(self.id())
+        (root / "comments.txt").write_bytes(_DUP_COMMENTS)
+        with _chdir(root):
+            result = renderer.process_comments("")
         self.assertEqual(len(result), 1)
 
     def test_home_prefix_applied(self):
-        from devto_mirror.site_generation import renderer
-
-        with tempfile.TemporaryDirectory() as td:
-            root = pathlib.Path(td)
-            (root / "comments.txt").write_text(
-                "https://dev.to/comment/abc|Context\n",
-                encoding="utf-8",
-            )
-            with _chdir(root):
-                result = renderer.process_comments("https://mysite.github.io/devto-mirror/")
+        root = _fresh_dir(self.id())
+        (root / "comments.txt").write_bytes(_SINGLE_COMMENT)
+        with _chdir(root):
+            result = renderer.process_comments("https://mysite.github.io/devto-mirror/")
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0]["url"], "https://dev.to/comment/abc")
 
 
 class TestGetTitleUser(unittest.TestCase):
     def test_devto_username_returned_directly(self):
-        from devto_mirror.site_generation import renderer
-
         result = renderer.get_title_user([], "myuser")
         self.assertEqual(result, "myuser")
 
-    def test_empty_posts_returns_empty_string(self):
-        from devto_mirror.site_generation import renderer
-
-        result = renderer.get_title_user([], "")
-        self.assertEqual(result, "")
+    def test_no_username_extractable_returns_empty(self):
+        cases = [
+            ("empty_posts", []),
+            ("no_link", [{"title": "No link post"}]),
+            ("empty_link", [{"link": ""}]),
+        ]
+        for name, posts in cases:
+            with self.subTest(name=name):
+                self.assertEqual(renderer.get_title_user(posts, ""), "")
 
     def test_extracts_username_from_post_link(self):
-        from devto_mirror.site_generation import renderer
-
         posts = [{"link": "https://dev.to/extracted_user/my-post-123"}]
         result = renderer.get_title_user(posts, "")
         self.assertEqual(result, "extracted_user")
 
-    def test_post_with_no_link_returns_empty(self):
-        from devto_mirror.site_generation import renderer
-
-        posts = [{"title": "No link post"}]
-        result = renderer.get_title_user(posts, "")
-        self.assertEqual(result, "")
-
-    def test_post_with_empty_link_returns_empty(self):
-        from devto_mirror.site_generation import renderer
-
-        posts = [{"link": ""}]
-        result = renderer.get_title_user(posts, "")
-        self.assertEqual(result, "")
-
     def test_exception_during_extraction_returns_empty(self):
-        from devto_mirror.site_generation import renderer
-
-        class BadPost(dict):
-            """A post dict whose .get() raises, triggering the except branch."""
-
-            def get(self, key, default=None):
-                raise RuntimeError("access error for testing")
-
+        # A post whose .get() raises, triggering the except branch.
+        bad = MagicMock(spec=dict)
+        bad.get.side_effect = RuntimeError("access error for testing")
         with patch("sys.stderr"):
-            result = renderer.get_title_user([BadPost()], "")
+            result = renderer.get_title_user([bad], "")
         self.assertEqual(result, "")
 
     def test_non_dict_post_with_link_attribute(self):
-        from devto_mirror.site_generation import renderer
-
         class PostObj:
             link = "https://dev.to/attr_user/post-1"
 
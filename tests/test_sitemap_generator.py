@@ -3,7 +3,7 @@ Tests for the AI Sitemap Generator module.
 """
 
 import unittest
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest.mock import Mock
 from xml.etree import ElementTree as ET  # nosec B405 - Used for parsing controlled test XML
 
@@ -254,8 +254,6 @@ class TestDevToAISitemapGenerator(unittest.TestCase):
 
     def test_determine_post_changefreq(self):
         """Test post change frequency determination."""
-        from datetime import timedelta
-
         # Test recent post (daily)
         recent_date = datetime.now() - timedelta(days=3)
         recent_post = Mock()
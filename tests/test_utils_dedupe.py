@@ -67,6 +67,17 @@ class TestDedupePostsByLink(unittest.TestCase):
         self.assertEqual(result[0]["id"], 1)
         self.assertEqual(result[0]["description"], "Desc")
 
+    def test_limit_returns_top_n_newest(self):
+        posts = [
+            {"id": 1, "link": "https://example.com/old", "date": "2024-01-01T00:00:00Z"},
+            {"id": 2, "link": "https://example.com/new", "date": "2024-01-03T00:00:00Z"},
+            {"id": 3, "link": "https://example.com/mid", "date": "2024-01-02T00:00:00Z"},
+        ]
+
+        result = dedupe_posts_by_link(posts, limit=2)
+
+        self.assertEqual([p["id"] for p in result], [2, 3])
+
 
 if __name__ == "__main__":
     unittest.main()